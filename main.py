@@ -196,8 +196,7 @@ def run_eda_pipeline(
         
         if save_intermediate:
             tech_file = output_path / "technical_analysis.json"
-            with open(tech_file, 'w') as f:
-                json.dump(technical_results, f, indent=2, default=str)
+            tech_file.write_bytes(json.dumps(technical_results, indent=2, default=str).encode('utf-8'))
         
         # =============================================================================
         # STEP 4: CORRELATION ANALYSIS
@@ -235,7 +234,9 @@ def run_eda_pipeline(
         logger.info("-" * 50)
         
         participant_dir = output_path / "participant_insights"
-        participant_results = generate_participant_insights(cleaned_data, participant_dir)
+        participant_results = generate_participant_insights(
+            cleaned_data, participant_dir, correlation_results
+        )
         
         logger.info(f"✅ Participant insights generated")
         logger.info(f"👥 Participants analyzed: {len(participant_results)}")
@@ -272,7 +273,7 @@ def run_eda_pipeline(
         
         # Generate dashboards
         dashboard_dir = output_path / "dashboards"
-        dashboards = generate_modern_dashboards(combined_results, dashboard_dir)
+        dashboards = generate_modern_dashboards(combined_results, dashboard_dir, keep_html=False)
         
         logger.info(f"✅ Dashboard generation completed")
         logger.info(f"📈 Researcher dashboard created: {dashboard_dir / 'researcher-dashboard.html'}")
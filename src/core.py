@@ -7,8 +7,11 @@ wearable health data (BP, sleep, steps, HR, SpO2, temperature).
 
 import pandas as pd
 import numpy as np
+import os
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union, Tuple, Any
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union, Tuple, Any
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import warnings
@@ -289,6 +292,74 @@ def convert_to_dataframe(records: List[HealthDataRecord]) -> pd.DataFrame:
     return pd.DataFrame(data)
 
 
+def records_to_columns(records: List[HealthDataRecord]) -> Dict[str, np.ndarray]:
+    """
+    Convert a list of HealthDataRecord to columnar NumPy arrays.
+    
+    Returns one array per field so analysis code can filter with boolean
+    masks instead of looping over record objects. ``value_2`` holds NaN
+    where a record has no secondary value; ``has_value_2`` marks the rest.
+    ``hour`` and ``weekday`` are taken from each record's own datetime.
+    """
+    n = len(records)
+    value_2 = [r.value_2 for r in records]
+    
+    return {
+        'metric_type': np.array([r.metric_type for r in records], dtype=object),
+        'quality_flag': np.array([r.quality_flag for r in records], dtype=object),
+        'value_1': np.fromiter((r.value_1 for r in records), dtype=np.float64, count=n),
+        'value_2': np.fromiter((np.nan if v is None else v for v in value_2), dtype=np.float64, count=n),
+        'has_value_2': np.fromiter((v is not None for v in value_2), dtype=bool, count=n),
+        'hour': np.fromiter((r.datetime.hour for r in records), dtype=np.int8, count=n),
+        'weekday': np.fromiter((r.datetime.weekday() for r in records), dtype=np.int8, count=n),
+    }
+
+
+# Cohorts smaller than this run in-process by default: pool start-up and
+# pickling each job cost more than fanning out saves
+PARALLEL_MIN_PARTICIPANTS = 200
+
+# Upper bound on jobs per pool task, so in-flight results stay bounded for any cohort size
+_MAX_JOBS_PER_CHUNK = 16
+
+
+def _run_job_chunk(func: Callable[[Any], Any], chunk: Sequence[Any]) -> List[Any]:
+    """Process-pool worker: apply func to one chunk of jobs"""
+    return [func(job) for job in chunk]
+
+
+def map_participant_jobs(
+    func: Callable[[Any], Any],
+    jobs: Sequence[Any],
+    min_parallel: int = PARALLEL_MIN_PARTICIPANTS,
+    serial_func: Optional[Callable[[Any], Any]] = None
+) -> Iterator[Any]:
+    """
+    Apply ``func`` to independent per-participant jobs, yielding results in job order.
+    
+    With fewer than ``min_parallel`` jobs, or a single CPU, the jobs run
+    in-process through ``serial_func`` (default ``func``), which may close over
+    shared state that should not be pickled. Otherwise they fan out to worker
+    processes, so ``func`` must be picklable. At most two chunks per worker are
+    in flight, so results are produced as the caller consumes them instead of
+    piling up for the whole cohort.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2 or len(jobs) < min_parallel:
+        yield from map(serial_func or func, jobs)
+        return
+    
+    chunksize = max(1, min(len(jobs) // (workers * 4), _MAX_JOBS_PER_CHUNK))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start in range(0, len(jobs), chunksize):
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+            pending.append(pool.submit(_run_job_chunk, func, jobs[start:start + chunksize]))
+        while pending:
+            yield from pending.popleft().result()
+
+
 class HealthDataCollection:
     """
     Container for managing multiple participants' health data.
@@ -306,11 +377,11 @@ class HealthDataCollection:
     
     def get_participant_data(self, participant_id: str) -> List[HealthDataRecord]:
         """Get all data for a specific participant"""
-        return [r for r in self.records if r.participant_id == participant_id]
+        return list(self.get_records_by_participant().get(participant_id, ()))
     
     def get_metric_data(self, metric_type: str) -> List[HealthDataRecord]:
         """Get all data for a specific metric type"""
-        return [r for r in self.records if r.metric_type == metric_type]
+        return list(self.get_records_by_metric().get(metric_type, ()))
     
     def get_participant_metric_data(
         self, 
@@ -321,6 +392,90 @@ class HealthDataCollection:
         return [r for r in self.records 
                 if r.participant_id == participant_id and r.metric_type == metric_type]
     
+    def get_records_by_participant(self) -> Dict[str, List[HealthDataRecord]]:
+        """Get all records bucketed by participant ID (one pass, cached until the data changes)"""
+        by_participant = self._index_cache.get('by_participant')
+        if by_participant is None:
+            by_participant = defaultdict(list)
+            for record in self.records:
+                by_participant[record.participant_id].append(record)
+            by_participant = dict(by_participant)
+            self._index_cache['by_participant'] = by_participant
+        return by_participant
+    
+    def get_records_by_metric(self) -> Dict[str, List[HealthDataRecord]]:
+        """Get all records bucketed by metric type (one pass, cached until the data changes)"""
+        by_metric = self._index_cache.get('by_metric')
+        if by_metric is None:
+            by_metric = defaultdict(list)
+            for record in self.records:
+                by_metric[record.metric_type].append(record)
+            by_metric = dict(by_metric)
+            self._index_cache['by_metric'] = by_metric
+        return by_metric
+    
+    def as_columns(self, participant_id: str) -> Dict[str, np.ndarray]:
+        """Get a participant's records as columnar arrays (see records_to_columns)"""
+        columns = self._index_cache.get('columns')
+        if columns is None:
+            # Built for every participant at once, from the shared participant buckets
+            columns = {pid: records_to_columns(records)
+                       for pid, records in self.get_records_by_participant().items()}
+            self._index_cache['columns'] = columns
+        
+        if participant_id not in columns:
+            return records_to_columns([])
+        return columns[participant_id]
+    
+    def as_frame(self, good_only: bool = False) -> pd.DataFrame:
+        """
+        Get the whole collection as one columnar DataFrame (cached until the data changes).
+        
+        With ``good_only`` the good-quality rows only, filtered once and
+        shared by every caller. Holds ``participant_id``, the records_to_columns arrays, an
+        ``is_good`` uint8 mask (quality_flag == 'good', compared once) and
+        the record ``datetime`` and ``date`` (calendar day of each record's own datetime).
+        ``participant_id``, ``metric_type`` and ``quality_flag`` are
+        categoricals, so filters on them compare integer codes.
+        """
+        if good_only:
+            good_frame = self._index_cache.get('good_frame')
+            if good_frame is None:
+                frame = self.as_frame()
+                good_frame = frame[frame['is_good'].to_numpy().astype(bool)]
+                self._index_cache['good_frame'] = good_frame
+            return good_frame
+        
+        frame = self._index_cache.get('frame')
+        if frame is None:
+            columns = records_to_columns(self.records)
+            frame = pd.DataFrame({
+                'participant_id': np.array([r.participant_id for r in self.records], dtype=object),
+                **columns,
+                'is_good': (columns['quality_flag'] == 'good').astype(np.uint8),
+                'datetime': pd.DatetimeIndex([r.datetime for r in self.records]),
+                'date': np.array([r.datetime.date() for r in self.records], dtype='datetime64[D]'),
+            })
+            frame = frame.astype({column: 'category' for column in ('participant_id', 'metric_type', 'quality_flag')})
+            self._index_cache['frame'] = frame
+        return frame
+    
+    def get_metric_values(self, metric_type: str, good_only: bool = True) -> np.ndarray:
+        """
+        Get ``value_1`` for one metric type as a float64 array (cached until the data changes).
+        
+        Only good-quality records are included unless ``good_only`` is False.
+        The returned array is shared between callers and is read-only.
+        """
+        metric_values = self._index_cache.setdefault('metric_values', {})
+        values = metric_values.get((metric_type, good_only))
+        if values is None:
+            frame = self.as_frame(good_only)
+            values = frame['value_1'].to_numpy()[(frame['metric_type'] == metric_type).to_numpy()]
+            values.flags.writeable = False
+            metric_values[(metric_type, good_only)] = values
+        return values
+    
     def get_participants(self) -> List[str]:
         """Get list of all participant IDs"""
         return list(set(r.participant_id for r in self.records))
@@ -14,6 +14,7 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, timedelta, date
 import json
+from collections import defaultdict
 from pathlib import Path
 from scipy.stats import pearsonr, spearmanr
 from sklearn.preprocessing import StandardScaler
@@ -222,10 +223,13 @@ class CorrelationEngine(BaseProcessor):
         """
         results = {}
         
+        # Shared with HealthDataCollection.as_columns, so the collection is bucketed once
+        by_participant = data.get_records_by_participant()
+        
         for participant_id in data.get_participants():
             self.logger.info(f"Analyzing correlations for participant: {participant_id}")
             
-            participant_data = data.get_participant_data(participant_id)
+            participant_data = by_participant[participant_id]
             participant_results = self._analyze_participant_correlations(
                 participant_data, participant_id
             )
@@ -275,21 +279,11 @@ class CorrelationEngine(BaseProcessor):
     def _create_daily_dataframe(self, records: List[HealthDataRecord]) -> pd.DataFrame:
         """Create daily aggregated DataFrame from records"""
         
-        # Group records by date and metric
-        daily_data = {}
+        # Group records by date and metric; multiple readings per day are aggregated below
+        daily_data = defaultdict(lambda: defaultdict(list))
         
         for record in records:
-            date = record.datetime.date()
-            metric = record.metric_type
-            
-            if date not in daily_data:
-                daily_data[date] = {}
-            
-            # Aggregate multiple readings per day
-            if metric not in daily_data[date]:
-                daily_data[date][metric] = []
-            
-            daily_data[date][metric].append(record.value_1)
+            daily_data[record.datetime.date()][record.metric_type].append(record.value_1)
         
         # Create DataFrame with daily averages
         df_data = []
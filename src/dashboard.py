@@ -2849,8 +2849,7 @@ def generate_dashboards(
         
         # Save researcher dashboard
         researcher_file = output_dir / "researcher-dashboard.html"
-        with open(researcher_file, 'w', encoding='utf-8') as f:
-            f.write(dashboards['researcher'])
+        researcher_file.write_bytes(dashboards['researcher'].encode('utf-8'))
         
         # Save participant dashboards
         participant_dir = output_dir / "participant-dashboards"
@@ -2858,8 +2857,7 @@ def generate_dashboards(
         
         for participant_id, html in dashboards['participants'].items():
             participant_file = participant_dir / f"{participant_id}.html"
-            with open(participant_file, 'w', encoding='utf-8') as f:
-                f.write(html)
+            participant_file.write_bytes(html.encode('utf-8'))
     
     return dashboards
 
@@ -11,10 +11,34 @@ from pathlib import Path
 import os
 import logging
 import base64
+import io
 import re
+from collections import defaultdict
+from functools import lru_cache
+from markupsafe import escape
 
 logger = logging.getLogger('integrated_report')
 
+# Display formats for deviation values, checked in order against the metric name
+_METRIC_DISPLAY_FORMATS = (
+    (('systolic', 'diastolic'), '{:.0f} mmHg'),
+    (('hr', 'heart'), '{:.0f} bpm'),
+    (('sleep',), '{:.1f} hours'),
+    (('step',), '{:.0f} steps'),
+    (('spo2', 'oxygen'), '{:.0f}%'),
+    (('temp',), '{:.1f}°C'),
+)
+_DEFAULT_DISPLAY_FORMAT = '{:.1f}'
+
+
+@lru_cache(maxsize=None)
+def _metric_display_format(metric_name: str) -> str:
+    """Resolve the display format for a metric name (cached per name)"""
+    for keywords, fmt in _METRIC_DISPLAY_FORMATS:
+        if any(keyword in metric_name for keyword in keywords):
+            return fmt
+    return _DEFAULT_DISPLAY_FORMAT
+
 class IntegratedReportGenerator:
     """
     Generates comprehensive HTML reports combining physiological, meals, and lungs data
@@ -890,109 +914,128 @@ class IntegratedReportGenerator:
         if not deviations_analysis or not isinstance(deviations_analysis, dict):
             return '<p class="text-gray-500">No deviation data available.</p>'
         
-        deviations_html = """
-        <div class="space-y-4">
-        """
-        
         # Check for significant changes
         significant_changes = deviations_analysis.get('significant_changes', [])
-        meal_correlations = deviations_analysis.get('meal_correlations', [])
-        metrics_info = deviations_analysis.get('metrics', {})
-        
         if not significant_changes:
             return '<p class="text-gray-500">No significant deviations detected.</p>'
         
+        meal_correlations = deviations_analysis.get('meal_correlations', [])
+        metrics_info = deviations_analysis.get('metrics', {})
+        
         # Map meals to dates for easier lookup
-        meals_by_date = {}
+        meals_by_date = defaultdict(list)
         for meal_corr in meal_correlations:
             date = meal_corr.get('date')
             if date:
-                if date not in meals_by_date:
-                    meals_by_date[date] = []
                 meals_by_date[date].append(meal_corr.get('meal', 'Unknown'))
         
-        # Group changes by date
-        changes_by_date = {}
-        for change in significant_changes:
-            date_str = change.get('date', 'Unknown')
-            if date_str not in changes_by_date:
-                changes_by_date[date_str] = []
-            changes_by_date[date_str].append(change)
+        # Group changes by date (as positions into significant_changes)
+        changes_by_date = defaultdict(list)
+        for i, change in enumerate(significant_changes):
+            changes_by_date[change.get('date', 'Unknown')].append(i)
+        
+        # Pull each change field out once, column by column
+        metric_names = [change.get('metric', 'Unknown') for change in significant_changes]
+        change_values = [change.get('value', 0) for change in significant_changes]
+        directions = [change.get('direction', 'unknown') for change in significant_changes]
+        
+        # Baseline mean, display format and formatted baseline per distinct metric
+        metric_baselines = {}
+        for metric_name in metric_names:
+            if metric_name not in metric_baselines:
+                mean_val = metrics_info.get(metric_name, {}).get('mean', 0)
+                display_format = _metric_display_format(metric_name)
+                metric_baselines[metric_name] = (mean_val, display_format, display_format.format(mean_val))
+        
+        # Deviation percentage and severity for all changes at once
+        n_changes = len(significant_changes)
+        values = np.fromiter(change_values, dtype=np.float64, count=n_changes)
+        means = np.fromiter(
+            (metric_baselines[metric_name][0] for metric_name in metric_names),
+            dtype=np.float64, count=n_changes
+        )
+        z_scores = np.fromiter(
+            (change.get('z_score', 0) for change in significant_changes),
+            dtype=np.float64, count=n_changes
+        )
+        deviation_pcts = np.zeros(n_changes)
+        np.divide(values - means, means, out=deviation_pcts, where=means != 0)
+        abs_deviation_pcts = np.abs(deviation_pcts * 100)
+        outside_thresholds = np.abs(z_scores) > 1.5
+        severe = ((abs_deviation_pcts > 20) | outside_thresholds).tolist()
+        abs_deviation_pcts = abs_deviation_pcts.tolist()
+        outside_thresholds = outside_thresholds.tolist()
         
         # Process each date with deviations
-        for date_str, changes in changes_by_date.items():
+        buf = io.StringIO()
+        write = buf.write
+        write("""
+        <div class="space-y-4">
+        """)
+        row_cache = {}
+        for date_str, change_indices in changes_by_date.items():
             # Get meals for this date
             meals_list = meals_by_date.get(date_str, [])
-            meals_str = ", ".join(meals_list) if meals_list else "No meals recorded"
+            meals_str = escape(", ".join(meals_list)) if meals_list else "No meals recorded"
             
-            deviations_html += f"""
+            write(f"""
             <div class="bg-white rounded-lg shadow-md p-4 mb-4">
-                <h3 class="text-lg font-semibold mb-2">Deviations on {date_str}</h3>
+                <h3 class="text-lg font-semibold mb-2">Deviations on {escape(date_str)}</h3>
                 <p class="mb-3 text-gray-600"><strong>Meals:</strong> {meals_str}</p>
                 <div class="space-y-3">
-            """
+            """)
             
             # Process each metric deviation for this date
-            for change in changes:
-                metric_name = change.get('metric', 'Unknown')
-                value = change.get('value', 0)
-                z_score = change.get('z_score', 0)
-                direction = change.get('direction', 'unknown')
-                
-                # Get baseline metrics if available
-                metric_info = metrics_info.get(metric_name, {})
-                mean_val = metric_info.get('mean', 0)
+            for i in change_indices:
+                metric_name = metric_names[i]
+                value = change_values[i]
+                direction = directions[i]
                 
-                # Calculate deviation percentage
-                deviation_pct = ((value - mean_val) / mean_val * 100) if mean_val != 0 else 0
-                outside_threshold = abs(z_score) > 1.5
-                
-                # Format display based on metric type
-                if 'systolic' in metric_name or 'diastolic' in metric_name:
-                    display_value = f"{value:.0f} mmHg"
-                    display_baseline = f"{mean_val:.0f} mmHg"
-                elif 'hr' in metric_name or 'heart' in metric_name:
-                    display_value = f"{value:.0f} bpm"
-                    display_baseline = f"{mean_val:.0f} bpm"
-                elif 'sleep' in metric_name:
-                    display_value = f"{value:.1f} hours"
-                    display_baseline = f"{mean_val:.1f} hours"
-                elif 'step' in metric_name:
-                    display_value = f"{value:.0f} steps"
-                    display_baseline = f"{mean_val:.0f} steps"
-                elif 'spo2' in metric_name or 'oxygen' in metric_name:
-                    display_value = f"{value:.0f}%"
-                    display_baseline = f"{mean_val:.0f}%"
-                elif 'temp' in metric_name:
-                    display_value = f"{value:.1f}°C"
-                    display_baseline = f"{mean_val:.1f}°C"
-                else:
-                    display_value = f"{value:.1f}"
-                    display_baseline = f"{mean_val:.1f}"
-                
-                # Direction of deviation and severity
-                severity_class = "text-red-600" if abs(deviation_pct) > 20 or outside_threshold else "text-amber-600"
-                
-                deviations_html += f"""
+                # Rows repeat across dates; the fragment is fully determined by this key
+                row_key = (metric_name, value, direction, outside_thresholds[i])
+                row_html = row_cache.get(row_key)
+                if row_html is None:
+                    # Format display based on metric type
+                    mean_val, display_format, display_baseline = metric_baselines[metric_name]
+                    display_value = display_format.format(value)
+                    
+                    # Direction of deviation and severity
+                    severity_class = "text-red-600" if severe[i] else "text-amber-600"
+                    
+                    if mean_val == 0:
+                        # No baseline to measure against, so no percentage to report
+                        row_html = f"""
+                <div class="bg-gray-50 p-3 rounded">
+                    <p class="font-medium {severity_class}">
+                        {escape(metric_name)} {escape(direction)}
+                        {" (outside normal threshold)" if outside_thresholds[i] else ""}
+                    </p>
+                    <p class="text-gray-600">Value: {display_value} (no baseline available)</p>
+                </div>
+                """
+                    else:
+                        row_html = f"""
                 <div class="bg-gray-50 p-3 rounded">
                     <p class="font-medium {severity_class}">
-                        {metric_name} {direction} by {abs(deviation_pct):.1f}%
-                        {" (outside normal threshold)" if outside_threshold else ""}
+                        {escape(metric_name)} {escape(direction)} by {abs_deviation_pcts[i]:.1f}%
+                        {" (outside normal threshold)" if outside_thresholds[i] else ""}
                     </p>
                     <p class="text-gray-600">Value: {display_value} (Baseline: {display_baseline})</p>
                 </div>
                 """
+                    row_cache[row_key] = row_html
+                write(row_html)
             
-            deviations_html += """
+            write("""
                 </div>
             </div>
-            """
+            """)
         
-        deviations_html += """
+        write("""
         </div>
-        """
+        """)
         
-        return deviations_html
+        return buf.getvalue()
 
 def generate_integrated_report(
     physio_data, 
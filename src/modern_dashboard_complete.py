@@ -10,49 +10,699 @@ A modern implementation using:
 This replaces the traditional CSS approach with a modern, responsive, and animated dashboard.
 """
 
+import hashlib
+import io
 import json
+import os
+import re
+import string
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple
 import logging
 
+from markupsafe import escape
+
+try:
+    from .core import map_participant_jobs
+except ImportError:  # run directly as a script
+    from core import map_participant_jobs
+
 logger = logging.getLogger(__name__)
 
 
-class ModernDashboardGenerator:
-    """
-    Complete modern dashboard generator using Tailwind CSS, Heroicons, and anime.js
-    """
-    
-    def __init__(self):
-        self.logger = logger
-    
-    def process(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate modern dashboards from analysis results"""
-        
-        self.logger.info("Generating modern HTML dashboards with Tailwind CSS")
-        
-        # Generate researcher dashboard
-        researcher_html = self._build_researcher_dashboard(analysis_results)
-        
-        # Generate participant dashboards
-        participant_dashboards = {}
-        participant_insights = analysis_results.get('participant_insights', {})
-        
-        for participant_id, insights in participant_insights.items():
-            participant_html = self._build_participant_dashboard(
-                participant_id, insights, analysis_results
-            )
-            participant_dashboards[participant_id] = participant_html
+# Data types grid rows: (metric_key, display name, icon, icon colour class)
+_DATA_TYPES = (
+    ('bp', 'Blood Pressure', 'heart', 'text-red-500'),
+    ('sleep', 'Sleep Quality', 'moon', 'text-purple-500'),
+    ('steps', 'Step Count', 'shoe-prints', 'text-green-500'),
+    ('hr', 'Heart Rate', 'activity', 'text-pink-500'),
+    ('spo2', 'Blood Oxygen', 'droplet', 'text-blue-500'),
+    ('temp', 'Temperature', 'thermometer', 'text-orange-500'),
+)
+
+# Recommendation category -> (colour, icon)
+_RECOMMENDATION_CATEGORIES = {
+    'exercise': ('green', 'shoe-prints'),
+    'sleep': ('purple', 'moon'),
+    'diet': ('orange', 'heart'),
+    'general': ('blue', 'sparkles'),
+    'medical': ('red', 'beaker'),
+}
+
+# Health baseline cards: metric -> (icon, colour); unknown metrics fall back to chart-bar/gray
+_BASELINE_METRIC_ICONS = {
+    'sleep': ('moon', 'purple'),
+    'hr': ('heart', 'red'),
+    'temp': ('thermometer', 'orange'),
+    'bp': ('activity', 'blue'),
+    'steps': ('shoe-prints', 'green'),
+    'spo2': ('droplet', 'cyan'),
+}
+
+# Data types grid: (status_class, icon_class, text_class, indicator_class) keyed
+# by availability; an empty icon_class means "use the metric's own colour"
+_DATA_TYPE_STYLES = {
+    True: ("bg-white dark:bg-gray-800 border-green-200 dark:border-green-700", "",
+           "text-gray-900 dark:text-white", "text-green-500"),
+    False: ("bg-gray-50 dark:bg-gray-900 border-gray-200 dark:border-gray-700 opacity-60", "text-gray-400",
+            "text-gray-500 dark:text-gray-400", "text-gray-400"),
+}
+
+_DATA_TYPE_CARD = """
+                <div class="{status_class} rounded-xl p-4 border-2 hover-lift transition-all">
+                    <div class="flex items-center justify-between mb-3">
+                        <div class="{icon_class}">
+                            {icon_svg}
+                        </div>
+                        <div class="{indicator_class}">
+                            {indicator_svg}
+                        </div>
+                    </div>
+                    <h3 class="font-medium {text_class} text-sm mb-2">
+                        {metric_name}
+                    </h3>
+                    
+                    {details_block}
+                </div>
+            """
+
+_DATA_TYPE_DETAILS = """
+                    <div class="space-y-1 text-xs text-gray-600 dark:text-gray-400">
+                        <div class="flex justify-between">
+                            <span>Records:</span>
+                            <span class="font-medium">{total_records:,}</span>
+                        </div>
+                        <div class="flex justify-between">
+                            <span>Quality:</span>
+                            <span class="font-medium">{good_percentage:.1f}%</span>
+                        </div>
+                        <div class="flex justify-between">
+                            <span>Participants:</span>
+                            <span class="font-medium">{participants_count}</span>
+                        </div>
+                    </div>
+                    """
+
+_DATA_TYPE_NO_DETAILS = '<div class="text-xs text-gray-400">No data available</div>'
+
+
+# Placeholder for the researcher technical analysis section when there is nothing to show
+_EMPTY_TECHNICAL_HTML = """
+            <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
+                <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
+                    Technical Analysis
+                </h2>
+                <p class="text-gray-600 dark:text-gray-400">
+                    No technical analysis data available.
+                </p>
+            </div>
+            """
+
+# Shared read-only stand-in for a missing or null pearson/spearman block
+_NO_STATS: Mapping[str, Any] = MappingProxyType({})
+
+# Correlation confidence labels counted as potential trends
+_TREND_CONFIDENCE_LEVELS = frozenset({'might be a thing', 'pretty sure'})
+
+# Placeholder for the researcher correlation section when there is nothing to show
+_EMPTY_CORRELATION_HTML = """
+        <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
+            <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
+                Comprehensive Correlation Analysis
+            </h2>
+            <p class="text-gray-600 dark:text-gray-400">
+                No correlation analysis data available.
+            </p>
+        </div>
+        """
+
+# Interpretation wording, indexed with bisect_right over the thresholds
+_SIGNIFICANCE_THRESHOLDS = (0.05, 0.1)
+_SIGNIFICANCE_NAMES = ("statistically significant", "marginally significant", "not statistically significant")
+_STRENGTH_THRESHOLDS = (0.4, 0.7)
+_STRENGTH_NAMES = ("weak", "moderate", "strong")
+_SAMPLE_SIZE_THRESHOLDS = (10, 20)
+_SAMPLE_SIZE_NOTES = (
+    " Note: Small sample size limits reliability of results.",
+    " Moderate sample size provides reasonable confidence.",
+    " Good sample size supports reliable conclusions.",
+)
+
+# Tailwind class strings for every palette colour the cards use
+_CARD_CLASSES = {
+    c: {
+        'gradient': f'from-{c}-50 to-{c}-100 dark:from-{c}-900/20 dark:to-{c}-800/20',
+        'icon': f'text-{c}-500',
+        'text': f'text-{c}-600',
+        'label': f'text-{c}-600 dark:text-{c}-400',
+        'bar': f'bg-{c}-500',
+        'border': f'border-{c}-200',
+        'badge': f'bg-{c}-100 text-{c}-800',
+    }
+    for c in ('blue', 'pink', 'orange', 'red', 'purple', 'green', 'yellow', 'gray', 'cyan', 'indigo')
+}
+
+# Metrics shown in the quality-by-metric grid, in display order, with their card tint
+_QUALITY_METRIC_COLORS = (
+    ('steps', 'blue'), ('hr', 'pink'), ('temp', 'orange'), ('bp', 'red'), ('sleep', 'purple'),
+)
+
+# Per-metric card in the researcher data quality section
+_QUALITY_METRIC_CARD = """
+                <div class="bg-gradient-to-br {tint[gradient]} rounded-xl p-4">
+                    <div class="flex items-center justify-between mb-3">
+                        <h4 class="font-semibold text-gray-900 dark:text-white capitalize">
+                            {metric}
+                        </h4>
+                        <div class="{quality[icon]}">
+                            {status_icon}
+                        </div>
+                    </div>
+                    
+                    <div class="mb-3">
+                        <div class="flex justify-between text-sm mb-1">
+                            <span class="text-gray-600 dark:text-gray-400">Quality Score</span>
+                            <span class="font-medium {quality[label]}">
+                                {percentage:.1f}%
+                            </span>
+                        </div>
+                        <div class="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-2">
+                            <div class="progress-bar {quality[bar]} h-2 rounded-full" 
+                                 data-width="{percentage}" style="width: 0%"></div>
+                        </div>
+                    </div>
+                    
+                    <div class="text-xs text-gray-600 dark:text-gray-400 space-y-1">
+                        <div class="flex justify-between">
+                            <span>Total Records:</span>
+                            <span class="font-medium">{total_metric_records:,}</span>
+                        </div>
+                        <div class="flex justify-between">
+                            <span>Good Records:</span>
+                            <span class="font-medium">{good_metric_records:,}</span>
+                        </div>
+                    </div>
+                </div>
+                """
+
+@dataclass(slots=True)
+class _CorrelationCardView:
+    """Display values for one correlation card, read by _CORRELATION_CARD"""
+    metrics: str
+    n_days: int
+    confidence: str
+    pearson_r: float
+    pearson_p: float
+    pearson_bar_width: float
+    spearman_r: float
+    spearman_p: float
+    spearman_bar_width: float
+    significance_badge: str
+    classes: Dict[str, str]  # _CARD_CLASSES entry for the significance colour
+    strength: str
+    strength_classes: Dict[str, str]
+    interpretation: str
+
+
+# Per-correlation card shared by the researcher and participant dashboards
+_CORRELATION_CARD = """
+        <div class="bg-white dark:bg-gray-800 rounded-xl p-6 border-2 {card.classes[border]} hover-lift">
+            <div class="flex items-center justify-between mb-4">
+                <h4 class="text-lg font-semibold text-gray-900 dark:text-white">
+                    {card.metrics}
+                </h4>
+                <span class="px-2 py-1 text-xs font-medium {card.classes[badge]} rounded-full">
+                    {card.significance_badge}
+                </span>
+            </div>
+            
+            <!-- Sample Size & Confidence -->
+            <div class="flex justify-between text-sm text-gray-600 dark:text-gray-400 mb-4">
+                <span>{card.n_days} days analyzed</span>
+                <span class="capitalize font-medium {card.strength_classes[text]}">{card.strength}</span>
+            </div>
+            
+            <!-- Correlation Values -->
+            <div class="space-y-3 mb-4">
+                <div>
+                    <div class="flex justify-between text-sm mb-1">
+                        <span class="font-medium text-gray-700 dark:text-gray-300">Pearson (Linear)</span>
+                        <span class="font-mono {card.classes[text]}">r = {card.pearson_r:.3f}</span>
+                    </div>
+                    <div class="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-2">
+                        <div class="{card.classes[bar]} h-2 rounded-full transition-all duration-500" 
+                             style="width: {card.pearson_bar_width}%"></div>
+                    </div>
+                    <div class="text-xs text-gray-500 mt-1">p = {card.pearson_p:.4f}</div>
+                </div>
+                
+                <div>
+                    <div class="flex justify-between text-sm mb-1">
+                        <span class="font-medium text-gray-700 dark:text-gray-300">Spearman (Rank)</span>
+                        <span class="font-mono {card.classes[text]}">ρ = {card.spearman_r:.3f}</span>
+                    </div>
+                    <div class="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-2">
+                        <div class="{card.classes[bar]} h-2 rounded-full transition-all duration-500" 
+                             style="width: {card.spearman_bar_width}%"></div>
+                    </div>
+                    <div class="text-xs text-gray-500 mt-1">p = {card.spearman_p:.4f}</div>
+                </div>
+            </div>
+            
+            <!-- Interpretation -->
+            <div class="bg-gray-50 dark:bg-gray-700 rounded-lg p-3">
+                <div class="text-xs font-medium text-gray-700 dark:text-gray-300 mb-1">Interpretation:</div>
+                <div class="text-xs text-gray-600 dark:text-gray-400 leading-relaxed">
+                    {card.interpretation}
+                </div>
+            </div>
+            
+            <!-- Confidence Level -->
+            <div class="mt-3 text-xs text-center">
+                <span class="px-2 py-1 bg-blue-100 text-blue-800 rounded-full capitalize">
+                    Analysis confidence: {card.confidence}
+                </span>
+            </div>
+        </div>
+        """
+
+# Available-metric badge on the researcher participant cards
+_METRIC_PILL = '<span class="px-2 py-1 bg-blue-100 text-blue-800 text-xs rounded-full">%s</span>'
+
+# Participant dashboard cards, filled per metric / finding / recommendation
+_BASELINE_RANGE_ROW = """
+                            <div class="flex justify-between">
+                                <span>Normal Range:</span>
+                                <span class="font-medium">{lower}-{upper}</span>
+                            </div>
+                            """
+
+_BASELINE_CARD = """
+                <div class="bg-gradient-to-br {tint[gradient]} rounded-xl p-6 hover-lift">
+                    <div class="flex items-center mb-4">
+                        <div class="{tint[icon]} mr-3">
+                            {icon_svg}
+                        </div>
+                        <h3 class="text-lg font-semibold text-gray-900 dark:text-white">
+                            {label}
+                        </h3>
+                    </div>
+                    
+                    <div class="space-y-3 mb-4">
+                        <div class="grid grid-cols-2 gap-4">
+                            <div class="text-center">
+                                <div class="text-xl font-bold {tint[text]}">{mean:.1f}</div>
+                                <div class="text-xs text-gray-600 dark:text-gray-400">Average</div>
+                            </div>
+                            <div class="text-center">
+                                <div class="text-xl font-bold {tint[text]}">{median:.1f}</div>
+                                <div class="text-xs text-gray-600 dark:text-gray-400">Median</div>
+                            </div>
+                        </div>
+                        
+                        <div class="space-y-1 text-sm text-gray-600 dark:text-gray-400">
+                            <div class="flex justify-between">
+                                <span>Records:</span>
+                                <span class="font-medium">{count:,}</span>
+                            </div>
+                            <div class="flex justify-between">
+                                <span>Std Dev:</span>
+                                <span class="font-medium">{std:.2f}</span>
+                            </div>
+                            {normal_range_row}
+                        </div>
+                    </div>
+                    
+                    <div class="bg-white/50 dark:bg-gray-800/50 rounded-lg p-3">
+                        <div class="text-xs font-medium text-gray-700 dark:text-gray-300 mb-1">Interpretation:</div>
+                        <div class="text-xs text-gray-600 dark:text-gray-400">{interpretation}</div>
+                    </div>
+                </div>
+                """
+
+_METRIC_TILE = """
+                <div class="{bg_class} rounded-xl p-4 text-center hover-lift {opacity_class}">
+                    <div class="{tint[icon]} mb-2 flex justify-center">
+                        {icon_svg}
+                    </div>
+                    <div class="text-2xl font-bold text-gray-900 dark:text-white mb-1">
+                        {display_value}
+                    </div>
+                    <div class="text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">
+                        {name}
+                    </div>
+                    <div class="text-xs text-gray-500 dark:text-gray-400">
+                        {unit}
+                    </div>
+                </div>
+            """
+
+_FINDING_CARD = """
+                <div class="bg-gradient-to-r {tint[gradient]} rounded-xl p-4 hover-lift">
+                    <div class="flex items-start space-x-3">
+                        <div class="{tint[icon]} mt-1">
+                            {icon_svg}
+                        </div>
+                        <div class="flex-1">
+                            <h3 class="font-semibold text-gray-900 dark:text-white mb-1">
+                                {title}
+                            </h3>
+                            <p class="text-sm text-gray-600 dark:text-gray-400">
+                                {description}
+                            </p>
+                            <span class="inline-block mt-2 px-2 py-1 {tint[badge]} text-xs rounded-full">
+                                {priority_label} Priority
+                            </span>
+                        </div>
+                    </div>
+                </div>
+            """
+
+_RECOMMENDATION_CARD = """
+                <div class="bg-gradient-to-br {tint[gradient]} rounded-xl p-4 hover-lift">
+                    <div class="flex items-start space-x-3">
+                        <div class="{tint[icon]} mt-1">
+                            {icon_svg}
+                        </div>
+                        <div class="flex-1">
+                            <h3 class="font-semibold text-gray-900 dark:text-white mb-2">
+                                {title}
+                            </h3>
+                            <p class="text-sm text-gray-600 dark:text-gray-400 mb-3">
+                                {description}
+                            </p>
+                            <div class="flex justify-between items-center">
+                                <span class="px-2 py-1 {tint[badge]} text-xs rounded-full">
+                                    {category_label}
+                                </span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            """
+
+# "Generated" stamp on participant pages
+_PARTICIPANT_STAMP_FORMAT = '%Y-%m-%d %H:%M'
+
+# Full correlation results written by the analysis step, preferred over the summary passed in
+_CORRELATION_FILE_PATH = str(Path(__file__).parents[1] / 'processed' / 'correlation_analysis.json')
+
+# Parsed correlation_analysis.json per path, reused until the file's mtime changes
+_CORRELATION_FILE_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+
+def _load_correlation_file(path: str) -> Any:
+    """Load a correlation analysis JSON file, re-parsing only when it has changed"""
+    mtime = os.path.getmtime(path)
+    cached = _CORRELATION_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r') as f:
+        data = json.load(f)
+    _CORRELATION_FILE_CACHE[path] = (mtime, data)
+    return data
+
+
+# Rendered correlation sections keyed by a digest of their input; oldest entry evicted first
+_CORRELATION_SECTION_CACHE: Dict[str, str] = {}
+_CORRELATION_SECTION_CACHE_SIZE = 8
+
+
+def _abs_pearson_r(item: Tuple[str, Dict[str, Any]]) -> float:
+    """Sort key ranking (name, correlation) pairs by absolute Pearson r; missing or null stats rank last"""
+    return abs((item[1].get('pearson') or _NO_STATS).get('r') or 0)
+
+
+def _initials(participant_id: str) -> str:
+    """Avatar initials: first letter of the first two words of a participant ID"""
+    initials = []
+    at_word_start = True
+    for ch in participant_id:
+        if ch == '-' or ch.isspace():
+            at_word_start = True
+        elif at_word_start:
+            initials.append(ch.upper())
+            if len(initials) == 2:
+                break
+            at_word_start = False
+    return str(escape(''.join(initials)[:2]))
+
+
+@lru_cache(maxsize=64)
+def _display_name(participant_id: str) -> str:
+    """HTML-escaped participant name, e.g. 'patient-a' -> 'Patient A'"""
+    return str(escape(participant_id.replace('-', ' ').title()))
+
+
+# Exact-type formatters for technical-analysis values (bool formats like the int it is)
+_VALUE_FORMATTERS = {
+    float: '{:.2f}'.format,
+    int: '{:,}'.format,
+    bool: '{:,}'.format,
+}
+
+
+def _format_value(value: Any) -> str:
+    """Format a technical-analysis value: floats to 2dp, ints with separators, text escaped"""
+    formatter = _VALUE_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    # Subclasses such as numpy.float64 miss the exact-type lookup
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(escape(value))
+
+# Heroicon outlines; only size and stroke width vary between call sites, so the
+# path markup is stored once and wrapped on demand
+_SVG_WRAPPER = '<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24">{path}</svg>'
+_ICON_FALLBACK = '<div class="w-{size} h-{size} bg-gray-300 rounded"></div>'
+
+_ICON_PATHS = {
+    'heart': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M4.318 6.318a4.5 4.5 0 000 6.364L12 20.364l7.682-7.682a4.5 4.5 0 00-6.364-6.364L12 7.636l-1.318-1.318a4.5 4.5 0 00-6.364 0z"></path>',
+    'chart-bar': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9 19v-6a2 2 0 00-2-2H5a2 2 0 00-2 2v6a2 2 0 002 2h2a2 2 0 002-2zm0 0V9a2 2 0 012-2h2a2 2 0 012 2v10m-6 0a2 2 0 002 2h2a2 2 0 00-2-2m0 0V5a2 2 0 012-2h2a2 2 0 012 2v14a2 2 0 01-2 2h-2a2 2 0 01-2-2z"></path>',
+    'users': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M12 4.354a4 4 0 110 5.292M15 21H3v-1a6 6 0 0112 0v1zm0 0h6v-1a6 6 0 00-9-5.197m13.5-9a4 4 0 11-8 0 4 4 0 018 0z"></path>',
+    'calendar': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M8 7V3m8 4V3m-9 8h10M5 21h14a2 2 0 002-2V7a2 2 0 00-2-2H5a2 2 0 00-2 2v12a2 2 0 002 2z"></path>',
+    'activity': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9 19v-6a2 2 0 00-2-2H5a2 2 0 00-2 2v6a2 2 0 002 2h2a2 2 0 002-2zm0 0V9a2 2 0 012-2h2a2 2 0 012 2v10m-6 0a2 2 0 002 2h2a2 2 0 00-2-2m0 0V5a2 2 0 012-2h2a2 2 0 012 2v14a2 2 0 01-2 2h-2a2 2 0 01-2-2z"></path>',
+    'moon': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M20.354 15.354A9 9 0 018.646 3.646 9.003 9.003 0 0012 21a9.003 9.003 0 008.354-5.646z"></path>',
+    'droplet': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M7.5 7.5h-.75A2.25 2.25 0 004.5 9.75v7.5a2.25 2.25 0 002.25 2.25h7.5a2.25 2.25 0 002.25-2.25v-7.5a2.25 2.25 0 00-2.25-2.25h-.75m0-3l-3-3-3 3m6 6l-3 3-3-3"></path>',
+    'thermometer': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path>',
+    'shoe-prints': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M13 10V3L4 14h7v7l9-11h-7z"></path>',
+    'check-circle': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path>',
+    'exclamation-triangle': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-2.5L13.732 4c-.77-.833-1.94-.833-2.71 0L3.204 16.5c-.77.833.192 2.5 1.732 2.5z"></path>',
+    'x-circle': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M10 14l2-2m0 0l2-2m-2 2l-2-2m2 2l2 2m7-2a9 9 0 11-18 0 9 9 0 0118 0z"></path>',
+    'link': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M13.19 8.688a4.5 4.5 0 011.242 7.244l-4.5 4.5a4.5 4.5 0 01-6.364-6.364l1.757-1.757m13.35-.622l1.757-1.757a4.5 4.5 0 00-6.364-6.364l-4.5 4.5a4.5 4.5 0 001.242 7.244"></path>',
+    'beaker': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9.75 3.104v5.714a2.25 2.25 0 01-.659 1.591L5 14.5a2.25 2.25 0 00-.659 1.591v3.159a2.25 2.25 0 002.25 2.25h14.159a2.25 2.25 0 002.25-2.25V16.09a2.25 2.25 0 00-.659-1.59L18.25 10.5a2.25 2.25 0 01-.659-1.591V3.104a2.25 2.25 0 00-2.25-2.25H12a2.25 2.25 0 00-2.25 2.25z"></path>',
+    'sparkles': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9.813 15.904L9 18.75l-.813-2.846a4.5 4.5 0 00-3.09-3.09L2.25 12l2.846-.813a4.5 4.5 0 003.09-3.09L9 5.25l.813 2.846a4.5 4.5 0 003.09 3.09L15.75 12l-2.846.813a4.5 4.5 0 00-3.09 3.09zM18.259 8.715L18 9.75l-.259-1.035a3.375 3.375 0 00-2.455-2.456L14.25 6l1.036-.259a3.375 3.375 0 002.455-2.456L18 2.25l.259 1.035a3.375 3.375 0 002.456 2.456L21.75 6l-1.035.259a3.375 3.375 0 00-2.456 2.456z"></path>',
+    'eye': '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M15 12a3 3 0 11-6 0 3 3 0 016 0z"></path><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M2.458 12C3.732 7.943 7.523 5 12 5c4.478 0 8.268 2.943 9.542 7-1.274 4.057-5.064 7-9.542 7-4.477 0-8.268-2.943-9.542-7z"></path>',
+}
+
+
+@lru_cache(maxsize=None)
+def _heroicon(name: str, size: str = "6", stroke_width: str = "1.5") -> str:
+    """Render a Heroicon SVG, memoized per (name, size, stroke_width)"""
+    path = _ICON_PATHS.get(name)
+    if path is None:
+        return _ICON_FALLBACK.format_map({'size': size})
+    return _SVG_WRAPPER.format_map({'size': size, 'path': path.format(stroke_width=stroke_width)})
+
+
+# Placeholder for the researcher participant overview when there are no insights
+_EMPTY_PARTICIPANT_HTML = """
+        <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
+            <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
+                Participant Overview
+            </h2>
         
-        return {
-            'researcher': researcher_html,
-            'participants': participant_dashboards
-        }
+            <div class="text-center py-8">
+                <div class="text-gray-400 mb-4">
+                    """ + _heroicon('users', '12') + """
+                </div>
+                <p class="text-gray-600 dark:text-gray-400">
+                    No participant data available.
+                </p>
+            </div>
+            
+        </div>
+        """
+
+
+# Empty states for the participant dashboard sections
+_EMPTY_BASELINES_HTML = """
+            <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
+                <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
+                    Health Baselines
+                </h2>
+                <div class="text-center py-8">
+                    <div class="text-gray-400 mb-4">
+                        """ + _heroicon('chart-bar', '12') + """
+                    </div>
+                    <p class="text-gray-600 dark:text-gray-400">
+                        No baseline data available.
+                    </p>
+                </div>
+            </div>
+            """
+
+_EMPTY_FINDINGS_HTML = """
+            <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
+                <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
+                    Key Findings
+                </h2>
+                <div class="text-center py-8">
+                    <div class="text-gray-400 mb-4">
+                        """ + _heroicon('sparkles', '12') + """
+                    </div>
+                    <p class="text-gray-600 dark:text-gray-400">
+                        No significant findings identified.
+                    </p>
+                </div>
+            </div>
+            """
+
+_EMPTY_RECOMMENDATIONS_HTML = """
+            <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
+                <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
+                    Health Recommendations
+                </h2>
+                <div class="text-center py-8">
+                    <div class="text-gray-400 mb-4">
+                        """ + _heroicon('check-circle', '12') + """
+                    </div>
+                    <p class="text-gray-600 dark:text-gray-400">
+                        No specific recommendations at this time.
+                    </p>
+                </div>
+            </div>
+            """
+
+_NO_PARTICIPANT_CORRELATIONS_HTML = """
+            <div class="text-center py-8">
+                <div class="text-gray-400 mb-4">
+                    """ + _heroicon('link', '12') + """
+                </div>
+                <p class="text-gray-600 dark:text-gray-400">
+                    No correlation analysis data available for your health metrics.
+                </p>
+            </div>
+        """
+
+
+# Participant overview tiles in display order: (key, name, icon, color, unit, value formatter)
+_PARTICIPANT_METRICS = (
+    ('steps', 'Steps', 'shoe-prints', 'green', 'avg/day', lambda value: f"{int(value):,}"),
+    ('hr', 'Heart Rate', 'heart', 'red', 'avg bpm', '{:.1f}'.format),
+    ('sleep', 'Sleep', 'moon', 'purple', 'avg hours', '{:.1f}'.format),
+    ('bp', 'Blood Pressure', 'activity', 'blue', 'avg mmHg', '{:.0f}'.format),
+    ('spo2', 'SpO2', 'droplet', 'cyan', 'avg %', '{:.1f}%'.format),
+    ('temp', 'Temperature', 'thermometer', 'orange', 'avg °F', '{:.1f}°F'.format),
+)
+
+
+def _metric_tile_variants(name: str, icon: str, color: str, unit: str) -> Tuple[str, str]:
+    """Pre-render a metric tile: an available template awaiting display_value, and the finished N/A tile"""
+    tint = _CARD_CLASSES[color]
+    fields = {'tint': tint, 'icon_svg': _heroicon(icon, '8'), 'name': name, 'unit': unit}
+    available = _METRIC_TILE.format(
+        bg_class=f"bg-gradient-to-br {tint['gradient']}",
+        opacity_class="", display_value="{display_value}", **fields,
+    )
+    unavailable = _METRIC_TILE.format(
+        bg_class="bg-gray-50 dark:bg-gray-800", opacity_class="opacity-50", display_value="N/A", **fields,
+    )
+    return available, unavailable
+
+
+# metric key -> (available tile template, unavailable tile HTML, value formatter)
+_METRIC_TILES = {
+    key: (*_metric_tile_variants(name, icon, color, unit), format_value)
+    for key, name, icon, color, unit, format_value in _PARTICIPANT_METRICS
+}
+
+# Participant overview stat cards in display order: (label, color, icon, extra icon class).
+# Pre-rendered at import, leaving only {value} to fill per participant.
+_STAT_CARD = """            <div class="animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl hover-lift">
+                <div class="flex items-center justify-between">
+                    <div>
+                        <p class="text-sm font-medium text-gray-600 dark:text-gray-400">
+                            {label}
+                        </p>
+                        <p class="text-3xl font-bold text-{color}-600 animate-stat">
+                            {{value}}
+                        </p>
+                    </div>
+                    <div class="text-{color}-500{glow}">
+                        {icon_svg}
+                    </div>
+                </div>
+            </div>"""
+_STAT_CARDS = tuple(
+    _STAT_CARD.format(label=label, color=color, icon_svg=_heroicon(icon, '10'), glow=glow)
+    for label, color, icon, glow in (
+        ('Key Findings', 'blue', 'sparkles', ' pulse-glow'),
+        ('Recommendations', 'green', 'check-circle', ''),
+        ('Data Types', 'purple', 'chart-bar', ''),
+        ('Monitoring Days', 'orange', 'calendar', ''),
+    )
+)
+
+
+
+# Tailwind colour palette, serialized once at import instead of living as
+# brace-escaped literal text inside the base template
+_TAILWIND_PALETTE = {
+    'primary': {
+        50: '#f0f9ff', 100: '#e0f2fe', 200: '#bae6fd', 300: '#7dd3fc', 400: '#38bdf8',
+        500: '#0ea5e9', 600: '#0284c7', 700: '#0369a1', 800: '#075985', 900: '#0c4a6e',
+    },
+    'success': {
+        50: '#f0fdf4', 100: '#dcfce7', 200: '#bbf7d0', 300: '#86efac', 400: '#4ade80',
+        500: '#22c55e', 600: '#16a34a', 700: '#15803d', 800: '#166534', 900: '#14532d',
+    },
+    'warning': {
+        50: '#fffbeb', 100: '#fef3c7', 200: '#fde68a', 300: '#fcd34d', 400: '#fbbf24',
+        500: '#f59e0b', 600: '#d97706', 700: '#b45309', 800: '#92400e', 900: '#78350f',
+    },
+    'error': {
+        50: '#fef2f2', 100: '#fee2e2', 200: '#fecaca', 300: '#fca5a5', 400: '#f87171',
+        500: '#ef4444', 600: '#dc2626', 700: '#b91c1c', 800: '#991b1b', 900: '#7f1d1d',
+    },
+}
+_TAILWIND_COLORS_JSON = json.dumps(_TAILWIND_PALETTE)
+# The base template goes through str.format, so literal braces must be doubled
+_TAILWIND_COLORS_FORMAT_SAFE = _TAILWIND_COLORS_JSON.replace('{', '{{').replace('}', '}}')
+
+_INLINE_BLOCK_RE = re.compile(r'(<(style|script)>)(.*?)(</\2>)', re.DOTALL)
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_JS_LINE_COMMENT_RE = re.compile(r'^\s*//.*$', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _minify_inline_blocks(html: str) -> str:
+    """Strip comments and collapse whitespace inside bare <style>/<script> blocks.
+
+    Tags with attributes (e.g. CDN ``<script src=...>``) and everything
+    outside the blocks, including Tailwind class attributes, are left as-is.
+    """
+    def minify(match: 're.Match') -> str:
+        open_tag, tag, content, close_tag = match.groups()
+        comment_re = _CSS_COMMENT_RE if tag == 'style' else _JS_LINE_COMMENT_RE
+        content = _WHITESPACE_RE.sub(' ', comment_re.sub('', content)).strip()
+        return f"{open_tag}{content}{close_tag}"
     
-    def _get_base_template(self) -> str:
-        """Get the base HTML template with modern stack includes"""
-        return """<!DOCTYPE html>
+    return _INLINE_BLOCK_RE.sub(minify, html)
+
+
+# Base HTML page; filled with {title} and {body_content}
+_BASE_TEMPLATE_SOURCE = """<!DOCTYPE html>
 <html lang="en" class="scroll-smooth">
 <head>
     <meta charset="UTF-8">
@@ -67,28 +717,7 @@ class ModernDashboardGenerator:
         tailwind.config = {{
             theme: {{
                 extend: {{
-                    colors: {{
-                        primary: {{
-                            50: '#f0f9ff', 100: '#e0f2fe', 200: '#bae6fd', 300: '#7dd3fc',
-                            400: '#38bdf8', 500: '#0ea5e9', 600: '#0284c7', 700: '#0369a1',
-                            800: '#075985', 900: '#0c4a6e'
-                        }},
-                        success: {{
-                            50: '#f0fdf4', 100: '#dcfce7', 200: '#bbf7d0', 300: '#86efac',
-                            400: '#4ade80', 500: '#22c55e', 600: '#16a34a', 700: '#15803d',
-                            800: '#166534', 900: '#14532d'
-                        }},
-                        warning: {{
-                            50: '#fffbeb', 100: '#fef3c7', 200: '#fde68a', 300: '#fcd34d',
-                            400: '#fbbf24', 500: '#f59e0b', 600: '#d97706', 700: '#b45309',
-                            800: '#92400e', 900: '#78350f'
-                        }},
-                        error: {{
-                            50: '#fef2f2', 100: '#fee2e2', 200: '#fecaca', 300: '#fca5a5',
-                            400: '#f87171', 500: '#ef4444', 600: '#dc2626', 700: '#b91c1c',
-                            800: '#991b1b', 900: '#7f1d1d'
-                        }}
-                    }},
+                    colors: """ + _TAILWIND_COLORS_FORMAT_SAFE + """,
                     animation: {{
                         'fade-in': 'fadeIn 0.5s ease-in-out',
                         'slide-in': 'slideIn 0.5s ease-out',
@@ -274,32 +903,104 @@ class ModernDashboardGenerator:
 
 </body>
 </html>"""
+_BASE_TEMPLATE = _minify_inline_blocks(_BASE_TEMPLATE_SOURCE)
+
+# The base template split once around its two fields, with {{ }} escapes already
+# resolved, so a page is a plain join instead of a str.format scan of the template
+def _split_base_template(template: str) -> Tuple[str, str, str]:
+    """Return the literal text before {title}, between the fields, and after {body_content}"""
+    segments, literal = [], []
+    for text, field, _, _ in string.Formatter().parse(template):
+        literal.append(text)
+        if field is not None:
+            segments.append("".join(literal))
+            literal = []
+    segments.append("".join(literal))
+    head, middle, tail = segments
+    return head, middle, tail
+
+
+_BASE_HEAD, _BASE_MIDDLE, _BASE_TAIL = _split_base_template(_BASE_TEMPLATE)
+
+
+class ModernDashboardGenerator:
+    """
+    Complete modern dashboard generator using Tailwind CSS, Heroicons, and anime.js
+    """
+    
+    def __init__(self):
+        self.logger = logger
+        self._base_template = _BASE_TEMPLATE
     
-    def _get_heroicon(self, name: str, size: str = "6", stroke_width: str = "1.5") -> str:
-        """Get Heroicon SVG markup"""
-        
-        icons = {
-            'heart': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M4.318 6.318a4.5 4.5 0 000 6.364L12 20.364l7.682-7.682a4.5 4.5 0 00-6.364-6.364L12 7.636l-1.318-1.318a4.5 4.5 0 00-6.364 0z"></path></svg>',
-            'chart-bar': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9 19v-6a2 2 0 00-2-2H5a2 2 0 00-2 2v6a2 2 0 002 2h2a2 2 0 002-2zm0 0V9a2 2 0 012-2h2a2 2 0 012 2v10m-6 0a2 2 0 002 2h2a2 2 0 00-2-2m0 0V5a2 2 0 012-2h2a2 2 0 012 2v14a2 2 0 01-2 2h-2a2 2 0 01-2-2z"></path></svg>',
-            'users': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M12 4.354a4 4 0 110 5.292M15 21H3v-1a6 6 0 0112 0v1zm0 0h6v-1a6 6 0 00-9-5.197m13.5-9a4 4 0 11-8 0 4 4 0 018 0z"></path></svg>',
-            'calendar': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M8 7V3m8 4V3m-9 8h10M5 21h14a2 2 0 002-2V7a2 2 0 00-2-2H5a2 2 0 00-2 2v12a2 2 0 002 2z"></path></svg>',
-            'activity': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9 19v-6a2 2 0 00-2-2H5a2 2 0 00-2 2v6a2 2 0 002 2h2a2 2 0 002-2zm0 0V9a2 2 0 012-2h2a2 2 0 012 2v10m-6 0a2 2 0 002 2h2a2 2 0 00-2-2m0 0V5a2 2 0 012-2h2a2 2 0 012 2v14a2 2 0 01-2 2h-2a2 2 0 01-2-2z"></path></svg>',
-            'moon': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M20.354 15.354A9 9 0 018.646 3.646 9.003 9.003 0 0012 21a9.003 9.003 0 008.354-5.646z"></path></svg>',
-            'droplet': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M7.5 7.5h-.75A2.25 2.25 0 004.5 9.75v7.5a2.25 2.25 0 002.25 2.25h7.5a2.25 2.25 0 002.25-2.25v-7.5a2.25 2.25 0 00-2.25-2.25h-.75m0-3l-3-3-3 3m6 6l-3 3-3-3"></path></svg>',
-            'thermometer': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path></svg>',
-            'shoe-prints': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M13 10V3L4 14h7v7l9-11h-7z"></path></svg>',
-            'check-circle': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path></svg>',
-            'exclamation-triangle': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-2.5L13.732 4c-.77-.833-1.94-.833-2.71 0L3.204 16.5c-.77.833.192 2.5 1.732 2.5z"></path></svg>',
-            'x-circle': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M10 14l2-2m0 0l2-2m-2 2l-2-2m2 2l2 2m7-2a9 9 0 11-18 0 9 9 0 0118 0z"></path></svg>',
-            'link': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M13.19 8.688a4.5 4.5 0 011.242 7.244l-4.5 4.5a4.5 4.5 0 01-6.364-6.364l1.757-1.757m13.35-.622l1.757-1.757a4.5 4.5 0 00-6.364-6.364l-4.5 4.5a4.5 4.5 0 001.242 7.244"></path></svg>',
-            'beaker': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9.75 3.104v5.714a2.25 2.25 0 01-.659 1.591L5 14.5a2.25 2.25 0 00-.659 1.591v3.159a2.25 2.25 0 002.25 2.25h14.159a2.25 2.25 0 002.25-2.25V16.09a2.25 2.25 0 00-.659-1.59L18.25 10.5a2.25 2.25 0 01-.659-1.591V3.104a2.25 2.25 0 00-2.25-2.25H12a2.25 2.25 0 00-2.25 2.25z"></path></svg>',
-            'sparkles': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M9.813 15.904L9 18.75l-.813-2.846a4.5 4.5 0 00-3.09-3.09L2.25 12l2.846-.813a4.5 4.5 0 003.09-3.09L9 5.25l.813 2.846a4.5 4.5 0 003.09 3.09L15.75 12l-2.846.813a4.5 4.5 0 00-3.09 3.09zM18.259 8.715L18 9.75l-.259-1.035a3.375 3.375 0 00-2.455-2.456L14.25 6l1.036-.259a3.375 3.375 0 002.455-2.456L18 2.25l.259 1.035a3.375 3.375 0 002.456 2.456L21.75 6l-1.035.259a3.375 3.375 0 00-2.456 2.456z"></path></svg>',
-            'eye': f'<svg class="w-{size} h-{size}" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M15 12a3 3 0 11-6 0 3 3 0 016 0z"></path><path stroke-linecap="round" stroke-linejoin="round" stroke-width="{stroke_width}" d="M2.458 12C3.732 7.943 7.523 5 12 5c4.478 0 8.268 2.943 9.542 7-1.274 4.057-5.064 7-9.542 7-4.477 0-8.268-2.943-9.542-7z"></path></svg>'
+    def process(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate modern dashboards from analysis results"""
+        
+        self.logger.info("Generating modern HTML dashboards with Tailwind CSS")
+        
+        # One timestamp for the whole run, so every page shows the same "Generated" time
+        generated_at = datetime.now()
+        
+        # Generate researcher dashboard
+        researcher_html = self._build_researcher_dashboard(analysis_results, generated_at)
+        
+        # Generate participant dashboards
+        participant_dashboards = dict(self._render_participant_dashboards(analysis_results, generated_at))
+        
+        return {
+            'researcher': researcher_html,
+            'participants': participant_dashboards
         }
+    
+    def iter_participant_dashboards(self, analysis_results: Dict[str, Any],
+                                    generated_at: Optional[datetime] = None) -> Iterator[Tuple[str, str]]:
+        """Lazily yield (participant_id, html) pairs, one dashboard at a time"""
+        
+        participant_insights = analysis_results.get('participant_insights', {})
+        generated = (generated_at or datetime.now()).strftime(_PARTICIPANT_STAMP_FORMAT)
+        
+        for participant_id, insights in participant_insights.items():
+            if not insights:
+                self.logger.debug(f"Skipping dashboard for {participant_id}: no insights")
+                continue
+            yield participant_id, self._build_participant_dashboard(
+                participant_id, insights, analysis_results, generated
+            )
+    
+    def _render_participant_dashboards(self, analysis_results: Dict[str, Any],
+                                       generated_at: datetime) -> Iterator[Tuple[str, str]]:
+        """Yield (participant_id, html) in cohort order, fanning out to worker processes for large cohorts"""
+        
+        participant_insights = analysis_results.get('participant_insights', {})
+        generated = generated_at.strftime(_PARTICIPANT_STAMP_FORMAT)
+        
+        jobs = []
+        for participant_id, insights in participant_insights.items():
+            if not insights:
+                self.logger.debug(f"Skipping dashboard for {participant_id}: no insights")
+                continue
+            jobs.append((participant_id, insights, generated))
         
-        return icons.get(name, f'<div class="w-{size} h-{size} bg-gray-300 rounded"></div>')
+        def render_in_process(job: Tuple[str, Dict[str, Any], str]) -> Tuple[str, str]:
+            participant_id, insights, generated = job
+            return participant_id, self._build_participant_dashboard(
+                participant_id, insights, analysis_results, generated
+            )
+        
+        yield from map_participant_jobs(_render_participant_job, jobs, serial_func=render_in_process)
+    
+    def _get_base_template(self) -> str:
+        """Get the base HTML template with modern stack includes"""
+        return self._base_template
+    
+    def _render_page(self, title: str, body_content: str) -> str:
+        """Wrap body content in the base template; same result as _get_base_template().format(...)"""
+        return "".join((_BASE_HEAD, title, _BASE_MIDDLE, body_content, _BASE_TAIL))
     
-    def _build_researcher_dashboard(self, data: Dict[str, Any]) -> str:
+    # Get Heroicon SVG markup; bound straight to the memoized module function so
+    # each card's icon is a single cache lookup
+    _get_heroicon = staticmethod(_heroicon)
+    
+    def _build_researcher_dashboard(self, data: Dict[str, Any], generated_at: Optional[datetime] = None) -> str:
         """Build the researcher dashboard with comprehensive modern styling"""
         
         # Extract comprehensive data
@@ -311,15 +1012,14 @@ class ModernDashboardGenerator:
         
         total_participants = loading_report.get('total_participants', 0)
         date_range = loading_report.get('date_range', {})
-        span_days = date_range.get('span_days', 0)
+        span_days = str(date_range.get('span_days', 0))
         start_date = date_range.get('start', 'Unknown')
         end_date = date_range.get('end', 'Unknown')
         
-        # Calculate comprehensive statistics
+        # Calculate comprehensive statistics, formatted once for every interpolation site
         overall_stats = cleaning_report.get('overall_stats', {})
-        total_records = overall_stats.get('total_records', 0)
-        good_records = overall_stats.get('quality_distribution', {}).get('good', 0)
-        data_quality_percentage = overall_stats.get('good_data_percentage', 0)
+        total_records_fmt = f"{overall_stats.get('total_records', 0):,}"
+        data_quality_fmt = f"{overall_stats.get('good_data_percentage', 0):.1f}%"
         
         # Metric availability with detailed stats
         metric_availability = loading_report.get('metric_availability', {})
@@ -344,7 +1044,7 @@ class ModernDashboardGenerator:
                 <div class="flex items-center space-x-4">
                     <div class="text-right">
                         <p class="text-sm text-gray-600 dark:text-gray-300">
-                            Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                            Generated: {(generated_at or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}
                         </p>
                         <p class="text-xs text-gray-500 dark:text-gray-400">
                             KCDH-A, Trivedi School of Biosciences, Ashoka University
@@ -383,7 +1083,7 @@ class ModernDashboardGenerator:
                             Total Records
                         </p>
                         <p class="text-3xl font-bold text-success-600 animate-stat">
-                            {total_records:,}
+                            {total_records_fmt}
                         </p>
                     </div>
                     <div class="text-success-500">
@@ -416,7 +1116,7 @@ class ModernDashboardGenerator:
                             Data Quality
                         </p>
                         <p class="text-3xl font-bold text-warning-600 animate-stat">
-                            {data_quality_percentage:.1f}%
+                            {data_quality_fmt}
                         </p>
                     </div>
                     <div class="text-warning-500">
@@ -435,7 +1135,7 @@ class ModernDashboardGenerator:
                         Analysis Period
                     </h3>
                     <p class="text-sm text-gray-600 dark:text-gray-300">
-                        {start_date} to {end_date} ({span_days} days)
+                        {escape(start_date)} to {escape(end_date)} ({span_days} days)
                     </p>
                 </div>
             </div>
@@ -463,96 +1163,55 @@ class ModernDashboardGenerator:
     </footer>
         """
         
-        return self._get_base_template().format(
-            title="GOQII Health Data - Comprehensive Research Dashboard",
-            body_content=body_content
-        )
+        return self._render_page("GOQII Health Data - Comprehensive Research Dashboard", body_content)
     
     def _build_enhanced_data_types_section(self, metric_availability: Dict[str, str], metric_stats: Dict[str, Any]) -> str:
         """Build enhanced data types availability section with detailed statistics"""
         
-        data_types = [
-            ('bp', 'Blood Pressure', 'heart', 'text-red-500'),
-            ('sleep', 'Sleep Quality', 'moon', 'text-purple-500'),
-            ('steps', 'Step Count', 'shoe-prints', 'text-green-500'),
-            ('hr', 'Heart Rate', 'activity', 'text-pink-500'),
-            ('spo2', 'Blood Oxygen', 'droplet', 'text-blue-500'),
-            ('temp', 'Temperature', 'thermometer', 'text-orange-500'),
-        ]
-        
-        html = """
+        header = """
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
                 Data Types & Statistics
             </h2>
             <div class="grid grid-cols-2 md:grid-cols-3 gap-6">
         """
+        footer = """
+            </div>
+        </div>
+        """
         
-        for metric_key, metric_name, icon, color_class in data_types:
+        get_heroicon = self._get_heroicon
+        indicators = {
+            True: get_heroicon('check-circle', '5', '2'),
+            False: get_heroicon('x-circle', '5', '2'),
+        }
+        
+        def card(metric_key: str, metric_name: str, icon: str, color_class: str) -> str:
             is_available = metric_availability.get(metric_key, '0') != '0'
-            metric_data = metric_stats.get(metric_key, {})
+            status_class, icon_class, text_class, indicator_class = _DATA_TYPE_STYLES[is_available]
             
             if is_available:
-                status_class = "bg-white dark:bg-gray-800 border-green-200 dark:border-green-700"
-                icon_class = color_class
-                text_class = "text-gray-900 dark:text-white"
-                indicator = self._get_heroicon('check-circle', '5', '2')
-                indicator_class = "text-green-500"
-                
-                # Extract detailed statistics
-                total_records = metric_data.get('total_records', 0)
-                good_percentage = metric_data.get('good_data_percentage', 0)
-                participants_count = metric_data.get('participants_with_data', 0)
-                
+                metric_data = metric_stats.get(metric_key, {})
+                details_block = _DATA_TYPE_DETAILS.format(
+                    total_records=metric_data.get('total_records', 0),
+                    good_percentage=metric_data.get('good_data_percentage', 0),
+                    participants_count=metric_data.get('participants_with_data', 0),
+                )
             else:
-                status_class = "bg-gray-50 dark:bg-gray-900 border-gray-200 dark:border-gray-700 opacity-60"
-                icon_class = "text-gray-400"
-                text_class = "text-gray-500 dark:text-gray-400"
-                indicator = self._get_heroicon('x-circle', '5', '2')
-                indicator_class = "text-gray-400"
-                total_records = 0
-                good_percentage = 0
-                participants_count = 0
+                details_block = _DATA_TYPE_NO_DETAILS
             
-            html += f"""
-                <div class="{status_class} rounded-xl p-4 border-2 hover-lift transition-all">
-                    <div class="flex items-center justify-between mb-3">
-                        <div class="{icon_class}">
-                            {self._get_heroicon(icon, '6')}
-                        </div>
-                        <div class="{indicator_class}">
-                            {indicator}
-                        </div>
-                    </div>
-                    <h3 class="font-medium {text_class} text-sm mb-2">
-                        {metric_name}
-                    </h3>
-                    
-                    {f'''
-                    <div class="space-y-1 text-xs text-gray-600 dark:text-gray-400">
-                        <div class="flex justify-between">
-                            <span>Records:</span>
-                            <span class="font-medium">{total_records:,}</span>
-                        </div>
-                        <div class="flex justify-between">
-                            <span>Quality:</span>
-                            <span class="font-medium">{good_percentage:.1f}%</span>
-                        </div>
-                        <div class="flex justify-between">
-                            <span>Participants:</span>
-                            <span class="font-medium">{participants_count}</span>
-                        </div>
-                    </div>
-                    ''' if is_available else '<div class="text-xs text-gray-400">No data available</div>'}
-                </div>
-            """
-        
-        html += """
-            </div>
-        </div>
-        """
+            return _DATA_TYPE_CARD.format(
+                status_class=status_class,
+                icon_class=icon_class or color_class,
+                icon_svg=get_heroicon(icon, '6'),
+                indicator_class=indicator_class,
+                indicator_svg=indicators[is_available],
+                text_class=text_class,
+                metric_name=metric_name,
+                details_block=details_block,
+            )
         
-        return html
+        return header + "".join(card(*data_type) for data_type in _DATA_TYPES) + footer
     
     def _build_comprehensive_quality_section(self, cleaning_report: Dict[str, Any]) -> str:
         """Build comprehensive data quality analysis section"""
@@ -573,14 +1232,13 @@ class ModernDashboardGenerator:
             </div>
             """
         
-        total_records = overall_stats.get('total_records', 0)
         quality_distribution = overall_stats.get('quality_distribution', {})
         good_records = quality_distribution.get('good', 0)
         invalid_records = quality_distribution.get('invalid', 0)
         duplicate_records = quality_distribution.get('duplicate', 0)
         outlier_records = quality_distribution.get('outlier', 0)
         
-        html = f"""
+        parts = [f"""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
                 Data Quality Analysis
@@ -613,12 +1271,15 @@ class ModernDashboardGenerator:
             <div class="mb-6">
                 <h3 class="text-lg font-semibold text-gray-900 dark:text-white mb-4">Quality by Metric</h3>
                 <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-        """
+        """]
         
-        metrics = ['steps', 'hr', 'temp', 'bp', 'sleep']
-        colors = ['blue', 'pink', 'orange', 'red', 'purple']
+        # Only two status icons are ever used, keyed on whether the metric passes
+        status_icons = {
+            True: self._get_heroicon('check-circle', '5'),
+            False: self._get_heroicon('exclamation-triangle', '5'),
+        }
         
-        for i, metric in enumerate(metrics):
+        for metric, color in _QUALITY_METRIC_COLORS:
             if metric in metric_stats:
                 data = metric_stats[metric]
                 total_metric_records = data.get('total_records', 0)
@@ -633,70 +1294,53 @@ class ModernDashboardGenerator:
                 else:
                     quality_color = "red"
                 
-                color = colors[i]
-                
-                html += f"""
-                <div class="bg-gradient-to-br from-{color}-50 to-{color}-100 dark:from-{color}-900/20 dark:to-{color}-800/20 rounded-xl p-4">
-                    <div class="flex items-center justify-between mb-3">
-                        <h4 class="font-semibold text-gray-900 dark:text-white capitalize">
-                            {metric}
-                        </h4>
-                        <div class="text-{quality_color}-500">
-                            {self._get_heroicon('check-circle' if percentage >= 80 else 'exclamation-triangle', '5')}
-                        </div>
-                    </div>
-                    
-                    <div class="mb-3">
-                        <div class="flex justify-between text-sm mb-1">
-                            <span class="text-gray-600 dark:text-gray-400">Quality Score</span>
-                            <span class="font-medium text-{quality_color}-600 dark:text-{quality_color}-400">
-                                {percentage:.1f}%
-                            </span>
-                        </div>
-                        <div class="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-2">
-                            <div class="progress-bar bg-{quality_color}-500 h-2 rounded-full" 
-                                 data-width="{percentage}" style="width: 0%"></div>
-                        </div>
-                    </div>
-                    
-                    <div class="text-xs text-gray-600 dark:text-gray-400 space-y-1">
-                        <div class="flex justify-between">
-                            <span>Total Records:</span>
-                            <span class="font-medium">{total_metric_records:,}</span>
-                        </div>
-                        <div class="flex justify-between">
-                            <span>Good Records:</span>
-                            <span class="font-medium">{good_metric_records:,}</span>
-                        </div>
-                    </div>
-                </div>
-                """
-        
-        html += """
+                parts.append(_QUALITY_METRIC_CARD.format(
+                    tint=_CARD_CLASSES[color], quality=_CARD_CLASSES[quality_color], metric=escape(metric),
+                    status_icon=status_icons[percentage >= 80],
+                    percentage=percentage, total_metric_records=total_metric_records,
+                    good_metric_records=good_metric_records,
+                ))
+        
+        parts.append("""
                 </div>
             </div>
         </div>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
     def _build_detailed_correlation_section(self, correlation_data: Dict[str, Any]) -> str:
         """Build comprehensive correlation analysis section showing all correlations with detailed interpretations"""
         
         # Load actual correlation analysis data if available
         try:
-            import json
-            import os
-            correlation_file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'processed', 'correlation_analysis.json')
-            if os.path.exists(correlation_file_path):
-                with open(correlation_file_path, 'r') as f:
-                    detailed_correlation_data = json.load(f)
-            else:
-                detailed_correlation_data = correlation_data
-        except:
+            detailed_correlation_data = _load_correlation_file(_CORRELATION_FILE_PATH)
+        except FileNotFoundError:
+            detailed_correlation_data = correlation_data
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load {_CORRELATION_FILE_PATH}, using in-memory correlations: {e}")
             detailed_correlation_data = correlation_data
         
-        html = f"""
+        if not detailed_correlation_data:
+            return _EMPTY_CORRELATION_HTML
+        
+        # The section depends only on the correlation data, so identical data
+        # (e.g. repeated refreshes off the same file) reuses the rendered HTML
+        cache_key = hashlib.blake2b(
+            json.dumps(detailed_correlation_data, sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16,
+        ).hexdigest()
+        html = _CORRELATION_SECTION_CACHE.get(cache_key)
+        if html is None:
+            html = self._render_detailed_correlation_section(detailed_correlation_data)
+            if len(_CORRELATION_SECTION_CACHE) >= _CORRELATION_SECTION_CACHE_SIZE:
+                del _CORRELATION_SECTION_CACHE[next(iter(_CORRELATION_SECTION_CACHE))]
+            _CORRELATION_SECTION_CACHE[cache_key] = html
+        return html
+    
+    def _render_detailed_correlation_section(self, detailed_correlation_data: Dict[str, Any]) -> str:
+        """Render the correlation section for already-loaded correlation data"""
+        parts = [f"""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-8 shadow-xl">
             <div class="flex items-center mb-6">
                 <div class="text-purple-500 mr-3">
@@ -713,7 +1357,7 @@ class ModernDashboardGenerator:
                     regardless of statistical significance, to provide transparency in the analytical process.
                 </p>
             </div>
-        """
+        """]
         
         # Process each participant's correlations
         for participant_id, participant_data in detailed_correlation_data.items():
@@ -724,27 +1368,29 @@ class ModernDashboardGenerator:
             data_summary = participant_data.get('data_summary', {})
             
             if not daily_correlations:
-                html += f"""
+                parts.append(f"""
                 <div class="bg-yellow-50 dark:bg-yellow-900/20 border-l-4 border-yellow-400 p-4 mb-6">
                     <p class="text-yellow-800 dark:text-yellow-200">
-                        No correlation analysis data available for {participant_id}.
+                        No correlation analysis data available for {escape(participant_id)}.
                     </p>
                 </div>
-                """
+                """)
                 continue
             
             # Calculate statistics
             total_tests = len(daily_correlations)
-            significant_count = sum(1 for corr in daily_correlations.values() 
-                                  if corr.get('pearson', {}).get('significant') == 'True' or 
-                                     corr.get('spearman', {}).get('significant') == 'True')
-            potential_trends = sum(1 for corr in daily_correlations.values() 
-                                 if corr.get('confidence') in ['might be a thing', 'pretty sure'])
+            significant_count = potential_trends = 0
+            for corr in daily_correlations.values():
+                if ((corr.get('pearson') or _NO_STATS).get('significant') == 'True' or
+                        (corr.get('spearman') or _NO_STATS).get('significant') == 'True'):
+                    significant_count += 1
+                if corr.get('confidence') in _TREND_CONFIDENCE_LEVELS:
+                    potential_trends += 1
             
-            html += f"""
+            parts.append(f"""
             <div class="mb-8">
                 <h3 class="text-xl font-semibold text-gray-900 dark:text-white mb-6">
-                    {participant_id.replace('-', ' ').title()} - All Correlation Tests
+                    {_display_name(participant_id)} - All Correlation Tests
                 </h3>
                 
                 <!-- Summary Stats -->
@@ -769,25 +1415,21 @@ class ModernDashboardGenerator:
                 
                 <!-- Correlation Results Grid -->
                 <div class="grid grid-cols-1 lg:grid-cols-2 xl:grid-cols-3 gap-6">
-            """
+            """)
             
             # Sort correlations by absolute pearson correlation value for better presentation
-            sorted_correlations = sorted(
-                daily_correlations.items(),
-                key=lambda x: abs(x[1].get('pearson', {}).get('r', 0)),
-                reverse=True
-            )
+            sorted_correlations = sorted(daily_correlations.items(), key=_abs_pearson_r, reverse=True)
             
             for correlation_name, correlation_data in sorted_correlations:
-                html += self._build_correlation_card(correlation_name, correlation_data)
+                parts.append(self._build_correlation_card(correlation_name, correlation_data))
             
-            html += """
+            parts.append("""
                 </div>
             </div>
-            """
+            """)
         
         # Add interpretation guide
-        html += """
+        parts.append("""
             <div class="mt-8 bg-gradient-to-r from-blue-50 to-purple-50 dark:from-blue-900/20 dark:to-purple-900/20 rounded-xl p-6">
                 <h4 class="text-lg font-semibold text-gray-900 dark:text-white mb-4">
                     Understanding Correlation Results
@@ -811,27 +1453,29 @@ class ModernDashboardGenerator:
                     </div>
                 </div>
             </div>
-        """
+        """)
         
-        html += """
+        parts.append("""
         </div>
-        """
+        """)
         
-        return html
-                    
-        return html
+        return "".join(parts)
     
     def _build_correlation_card(self, correlation_name: str, correlation_data: Dict[str, Any]) -> str:
         """Build individual correlation analysis card with detailed results"""
+        return _CORRELATION_CARD.format(card=self._correlation_card_view(correlation_name, correlation_data))
+    
+    def _correlation_card_view(self, correlation_name: str, correlation_data: Dict[str, Any]) -> '_CorrelationCardView':
+        """Derive every value the correlation card template needs in one pass"""
         
         # Extract metrics from correlation name
-        metrics = correlation_name.replace('_vs_', ' vs ').replace('_', ' ').title()
+        metrics = escape(correlation_name.replace('_vs_', ' vs ').replace('_', ' ').title())
         
         # Get correlation statistics
-        pearson = correlation_data.get('pearson', {})
-        spearman = correlation_data.get('spearman', {})
+        pearson = correlation_data.get('pearson') or _NO_STATS
+        spearman = correlation_data.get('spearman') or _NO_STATS
         n_days = correlation_data.get('n_days', 0)
-        confidence = correlation_data.get('confidence', 'unknown')
+        confidence = escape(correlation_data.get('confidence', 'unknown'))
         
         pearson_r = pearson.get('r', 0)
         pearson_p = pearson.get('p_value', 1)
@@ -845,18 +1489,17 @@ class ModernDashboardGenerator:
         if is_significant:
             card_color = "green"
             significance_badge = "Significant"
-            border_class = "border-green-200"
         elif is_marginal:
             card_color = "yellow"
             significance_badge = "Marginal"
-            border_class = "border-yellow-200"
         else:
             card_color = "gray"
             significance_badge = "Not Significant"
-            border_class = "border-gray-200"
         
         # Determine correlation strength
-        max_abs_r = max(abs(pearson_r), abs(spearman_r))
+        abs_pearson_r = abs(pearson_r)
+        abs_spearman_r = abs(spearman_r)
+        max_abs_r = abs_pearson_r if abs_pearson_r > abs_spearman_r else abs_spearman_r
         if max_abs_r >= 0.7:
             strength = "Strong"
             strength_color = "green"
@@ -868,72 +1511,21 @@ class ModernDashboardGenerator:
             strength_color = "orange"
         
         # Create interpretation
-        interpretation = self._get_correlation_interpretation(correlation_name, pearson_r, pearson_p, n_days)
+        interpretation = escape(self._get_correlation_interpretation(correlation_name, pearson_r, pearson_p, n_days))
         
         # Correlation visualization (simple progress bar representation)
-        pearson_bar_width = min(abs(pearson_r) * 100, 100)
-        spearman_bar_width = min(abs(spearman_r) * 100, 100)
-        
-        return f"""
-        <div class="bg-white dark:bg-gray-800 rounded-xl p-6 border-2 {border_class} hover-lift">
-            <div class="flex items-center justify-between mb-4">
-                <h4 class="text-lg font-semibold text-gray-900 dark:text-white">
-                    {metrics}
-                </h4>
-                <span class="px-2 py-1 text-xs font-medium bg-{card_color}-100 text-{card_color}-800 rounded-full">
-                    {significance_badge}
-                </span>
-            </div>
-            
-            <!-- Sample Size & Confidence -->
-            <div class="flex justify-between text-sm text-gray-600 dark:text-gray-400 mb-4">
-                <span>{n_days} days analyzed</span>
-                <span class="capitalize font-medium text-{strength_color}-600">{strength}</span>
-            </div>
-            
-            <!-- Correlation Values -->
-            <div class="space-y-3 mb-4">
-                <div>
-                    <div class="flex justify-between text-sm mb-1">
-                        <span class="font-medium text-gray-700 dark:text-gray-300">Pearson (Linear)</span>
-                        <span class="font-mono text-{card_color}-600">r = {pearson_r:.3f}</span>
-                    </div>
-                    <div class="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-2">
-                        <div class="bg-{card_color}-500 h-2 rounded-full transition-all duration-500" 
-                             style="width: {pearson_bar_width}%"></div>
-                    </div>
-                    <div class="text-xs text-gray-500 mt-1">p = {pearson_p:.4f}</div>
-                </div>
-                
-                <div>
-                    <div class="flex justify-between text-sm mb-1">
-                        <span class="font-medium text-gray-700 dark:text-gray-300">Spearman (Rank)</span>
-                        <span class="font-mono text-{card_color}-600">ρ = {spearman_r:.3f}</span>
-                    </div>
-                    <div class="w-full bg-gray-200 dark:bg-gray-700 rounded-full h-2">
-                        <div class="bg-{card_color}-500 h-2 rounded-full transition-all duration-500" 
-                             style="width: {spearman_bar_width}%"></div>
-                    </div>
-                    <div class="text-xs text-gray-500 mt-1">p = {spearman_p:.4f}</div>
-                </div>
-            </div>
-            
-            <!-- Interpretation -->
-            <div class="bg-gray-50 dark:bg-gray-700 rounded-lg p-3">
-                <div class="text-xs font-medium text-gray-700 dark:text-gray-300 mb-1">Interpretation:</div>
-                <div class="text-xs text-gray-600 dark:text-gray-400 leading-relaxed">
-                    {interpretation}
-                </div>
-            </div>
-            
-            <!-- Confidence Level -->
-            <div class="mt-3 text-xs text-center">
-                <span class="px-2 py-1 bg-blue-100 text-blue-800 rounded-full capitalize">
-                    Analysis confidence: {confidence}
-                </span>
-            </div>
-        </div>
-        """
+        # Stored r values can overshoot 1.0 by float error, so keep the clamp
+        pearson_bar_width = min(abs_pearson_r * 100, 100)
+        spearman_bar_width = min(abs_spearman_r * 100, 100)
+        
+        return _CorrelationCardView(
+            metrics=metrics, n_days=n_days, confidence=confidence,
+            pearson_r=pearson_r, pearson_p=pearson_p, pearson_bar_width=pearson_bar_width,
+            spearman_r=spearman_r, spearman_p=spearman_p, spearman_bar_width=spearman_bar_width,
+            significance_badge=significance_badge, classes=_CARD_CLASSES[card_color],
+            strength=strength, strength_classes=_CARD_CLASSES[strength_color],
+            interpretation=interpretation,
+        )
     
     def _get_correlation_interpretation(self, correlation_name: str, r_value: float, p_value: float, n_days: int) -> str:
         """Generate detailed interpretation for correlation results"""
@@ -942,81 +1534,60 @@ class ModernDashboardGenerator:
         metrics = correlation_name.replace('_vs_', ' and ').replace('_', ' ')
         
         # Statistical significance
-        if p_value < 0.05:
-            significance = "statistically significant"
-        elif p_value < 0.1:
-            significance = "marginally significant"
-        else:
-            significance = "not statistically significant"
+        significance_level = bisect_right(_SIGNIFICANCE_THRESHOLDS, p_value)
+        significance = _SIGNIFICANCE_NAMES[significance_level]
         
-        # Correlation strength and direction
+        # Correlation strength and direction; a NaN r fails every threshold, so it is weak
         abs_r = abs(r_value)
-        if abs_r >= 0.7:
-            strength = "strong"
-        elif abs_r >= 0.4:
-            strength = "moderate"
-        else:
-            strength = "weak"
-        
+        strength = _STRENGTH_NAMES[bisect_right(_STRENGTH_THRESHOLDS, abs_r)] if abs_r == abs_r else 'weak'
         direction = "positive" if r_value > 0 else "negative"
         
         # Sample size consideration
-        sample_note = ""
-        if n_days < 10:
-            sample_note = " Note: Small sample size limits reliability of results."
-        elif n_days < 20:
-            sample_note = " Moderate sample size provides reasonable confidence."
-        else:
-            sample_note = " Good sample size supports reliable conclusions."
-        
-        # Build interpretation
-        if p_value < 0.05:
-            interpretation = f"There is a {strength} {direction} relationship between {metrics} (r={r_value:.3f}, p={p_value:.4f}). This relationship is {significance}."
-        else:
-            interpretation = f"The analysis shows a {strength} {direction} trend between {metrics} (r={r_value:.3f}), but this relationship is {significance} (p={p_value:.4f}). This could be due to chance or insufficient data."
-        
-        # Add practical interpretation based on metrics
+        sample_note = _SAMPLE_SIZE_NOTES[bisect_right(_SAMPLE_SIZE_THRESHOLDS, n_days)]
+        practical_note = self._get_practical_note(correlation_name, r_value)
+        
+        if significance_level == 0:
+            return (f"There is a {strength} {direction} relationship between {metrics} "
+                    f"(r={r_value:.3f}, p={p_value:.4f}). This relationship is {significance}."
+                    f"{practical_note}{sample_note}")
+        return (f"The analysis shows a {strength} {direction} trend between {metrics} (r={r_value:.3f}), "
+                f"but this relationship is {significance} (p={p_value:.4f}). "
+                f"This could be due to chance or insufficient data.{practical_note}{sample_note}")
+    
+    def _get_practical_note(self, correlation_name: str, r_value: float) -> str:
+        """Plain-language reading of a correlation for the metric pairs we know about"""
         if 'steps' in correlation_name and 'sleep' in correlation_name:
             if r_value > 0:
-                interpretation += " This suggests that more physical activity might be associated with better sleep patterns."
-            else:
-                interpretation += " This suggests that higher activity levels might be associated with shorter sleep duration, possibly due to lifestyle factors."
-        elif 'heart rate' in correlation_name.lower() or 'hr' in correlation_name:
+                return " This suggests that more physical activity might be associated with better sleep patterns."
+            return " This suggests that higher activity levels might be associated with shorter sleep duration, possibly due to lifestyle factors."
+        if 'heart rate' in correlation_name.lower() or 'hr' in correlation_name:
             if 'steps' in correlation_name and r_value > 0:
-                interpretation += " This indicates that more physical activity is associated with elevated heart rate, as expected."
-            elif 'temp' in correlation_name:
-                interpretation += " This relationship between heart rate and temperature could reflect physiological responses."
-        
-        interpretation += sample_note
-        
-        return interpretation
+                return " This indicates that more physical activity is associated with elevated heart rate, as expected."
+            if 'temp' in correlation_name:
+                return " This relationship between heart rate and temperature could reflect physiological responses."
+        return ""
     
     def _build_technical_analysis_section(self, technical_analysis: Dict[str, Any]) -> str:
         """Build technical analysis section with detailed statistics"""
         
         if not technical_analysis:
-            return """
-            <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
-                <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
-                    Technical Analysis
-                </h2>
-                <p class="text-gray-600 dark:text-gray-400">
-                    No technical analysis data available.
-                </p>
-            </div>
-            """
+            return _EMPTY_TECHNICAL_HTML
         
         cohort_summary = technical_analysis.get('cohort_summary', {})
         data_completeness = technical_analysis.get('data_completeness', {})
         
-        html = f"""
+        buf = io.StringIO()
+        write = buf.write
+        write("""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
                 Technical Analysis
             </h2>
             
             <!-- Cohort Summary -->
-            {f'''
+            """)
+        if cohort_summary:
+            write(f"""
             <div class="mb-6">
                 <h3 class="text-lg font-semibold text-gray-900 dark:text-white mb-4">Cohort Overview</h3>
                 <div class="grid grid-cols-1 md:grid-cols-2 gap-6">
@@ -1025,54 +1596,51 @@ class ModernDashboardGenerator:
                     </div>
                 </div>
             </div>
-            ''' if cohort_summary else ''}
+            """)
+        write("""
             
             <!-- Data Completeness -->
-            {f'''
+            """)
+        if data_completeness:
+            write(f"""
             <div class="mb-6">
                 <h3 class="text-lg font-semibold text-gray-900 dark:text-white mb-4">Data Completeness</h3>
                 <div class="space-y-3">
                     {self._format_completeness_data(data_completeness)}
                 </div>
             </div>
-            ''' if data_completeness else ''}
+            """)
+        write("""
         </div>
-        """
+        """)
         
-        return html
+        return buf.getvalue()
     
     def _format_technical_data(self, title: str, data: Any) -> str:
         """Format technical data for display"""
         if isinstance(data, dict):
-            html = f'<div class="bg-gray-50 dark:bg-gray-800 rounded-lg p-4">'
-            html += f'<h4 class="font-medium text-gray-900 dark:text-white mb-3">{title}</h4>'
-            html += '<div class="space-y-2 text-sm">'
+            parts = [
+                '<div class="bg-gray-50 dark:bg-gray-800 rounded-lg p-4">',
+                f'<h4 class="font-medium text-gray-900 dark:text-white mb-3">{title}</h4>',
+                '<div class="space-y-2 text-sm">',
+            ]
             
             for key, value in data.items():
-                formatted_key = key.replace('_', ' ').title()
-                if isinstance(value, (int, float)):
-                    if isinstance(value, float):
-                        formatted_value = f"{value:.2f}"
-                    else:
-                        formatted_value = f"{value:,}"
-                else:
-                    formatted_value = str(value)
-                
-                html += f'''
+                parts.append(f'''
                 <div class="flex justify-between">
-                    <span class="text-gray-600 dark:text-gray-400">{formatted_key}:</span>
-                    <span class="font-medium text-gray-900 dark:text-white">{formatted_value}</span>
+                    <span class="text-gray-600 dark:text-gray-400">{escape(key.replace('_', ' ').title())}:</span>
+                    <span class="font-medium text-gray-900 dark:text-white">{_format_value(value)}</span>
                 </div>
-                '''
+                ''')
             
-            html += '</div></div>'
-            return html
+            parts.append('</div></div>')
+            return "".join(parts)
         else:
-            return f'<div class="text-sm text-gray-600 dark:text-gray-400">{data}</div>'
+            return f'<div class="text-sm text-gray-600 dark:text-gray-400">{escape(data)}</div>'
     
     def _format_completeness_data(self, data: Dict[str, Any]) -> str:
         """Format data completeness information"""
-        html = ""
+        parts = []
         for item_key, completeness in data.items():
             if isinstance(completeness, (int, float)):
                 percentage = completeness
@@ -1083,9 +1651,9 @@ class ModernDashboardGenerator:
                 else:
                     color = "red"
                 
-                html += f'''
+                parts.append(f'''
                 <div class="flex items-center justify-between p-3 bg-gray-50 dark:bg-gray-800 rounded-lg">
-                    <span class="font-medium text-gray-900 dark:text-white">{item_key.replace('_', ' ').title()}</span>
+                    <span class="font-medium text-gray-900 dark:text-white">{escape(item_key.replace('_', ' ').title())}</span>
                     <div class="flex items-center space-x-3">
                         <div class="w-24 bg-gray-200 dark:bg-gray-700 rounded-full h-2">
                             <div class="progress-bar bg-{color}-500 h-2 rounded-full" 
@@ -1096,128 +1664,127 @@ class ModernDashboardGenerator:
                         </span>
                     </div>
                 </div>
-                '''
+                ''')
         
-        return html
+        return "".join(parts)
     
     def _build_enhanced_participant_section(self, participant_insights: Dict[str, Any]) -> str:
         """Build enhanced participant overview section"""
         
-        html = """
+        if not participant_insights:
+            return _EMPTY_PARTICIPANT_HTML
+        
+        items = list(participant_insights.items())
+        total_findings = total_recommendations = 0
+        for _, insights in items:
+            total_findings += len(insights.get('findings', ()))
+            total_recommendations += len(insights.get('recommendations', ()))
+        
+        parts = ["""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
                 Participant Overview
             </h2>
-        """
-        
-        if not participant_insights:
-            html += f"""
-            <div class="text-center py-8">
-                <div class="text-gray-400 mb-4">
-                    {self._get_heroicon('users', '12')}
+        """]
+        
+        parts.append(f"""
+        <div class="mb-6">
+            <div class="grid grid-cols-1 md:grid-cols-3 gap-4 mb-6">
+                <div class="bg-gradient-to-br from-blue-50 to-blue-100 dark:from-blue-900/20 dark:to-blue-800/20 rounded-xl p-4 text-center">
+                    <div class="text-2xl font-bold text-blue-600">{len(items)}</div>
+                    <div class="text-sm text-gray-600 dark:text-gray-400">Total Participants</div>
                 </div>
-                <p class="text-gray-600 dark:text-gray-400">
-                    No participant data available.
-                </p>
-            </div>
-            """
-        else:
-            html += f"""
-            <div class="mb-6">
-                <div class="grid grid-cols-1 md:grid-cols-3 gap-4 mb-6">
-                    <div class="bg-gradient-to-br from-blue-50 to-blue-100 dark:from-blue-900/20 dark:to-blue-800/20 rounded-xl p-4 text-center">
-                        <div class="text-2xl font-bold text-blue-600">{len(participant_insights)}</div>
-                        <div class="text-sm text-gray-600 dark:text-gray-400">Total Participants</div>
-                    </div>
-                    <div class="bg-gradient-to-br from-green-50 to-green-100 dark:from-green-900/20 dark:to-green-800/20 rounded-xl p-4 text-center">
-                        <div class="text-2xl font-bold text-green-600">{sum(len(insights.get('findings', [])) for insights in participant_insights.values())}</div>
-                        <div class="text-sm text-gray-600 dark:text-gray-400">Total Findings</div>
-                    </div>
-                    <div class="bg-gradient-to-br from-purple-50 to-purple-100 dark:from-purple-900/20 dark:to-purple-800/20 rounded-xl p-4 text-center">
-                        <div class="text-2xl font-bold text-purple-600">{sum(len(insights.get('recommendations', [])) for insights in participant_insights.values())}</div>
-                        <div class="text-sm text-gray-600 dark:text-gray-400">Recommendations</div>
-                    </div>
+                <div class="bg-gradient-to-br from-green-50 to-green-100 dark:from-green-900/20 dark:to-green-800/20 rounded-xl p-4 text-center">
+                    <div class="text-2xl font-bold text-green-600">{total_findings}</div>
+                    <div class="text-sm text-gray-600 dark:text-gray-400">Total Findings</div>
+                </div>
+                <div class="bg-gradient-to-br from-purple-50 to-purple-100 dark:from-purple-900/20 dark:to-purple-800/20 rounded-xl p-4 text-center">
+                    <div class="text-2xl font-bold text-purple-600">{total_recommendations}</div>
+                    <div class="text-sm text-gray-600 dark:text-gray-400">Recommendations</div>
                 </div>
             </div>
+        </div>
+        
+        <div class="grid grid-cols-1 lg:grid-cols-2 gap-6">
+        """)
+        
+        for participant_id, insights in items:
+            data_period = insights.get('data_period', {})
+            date_range = data_period.get('date_range', {})
+            start_date = date_range.get('start', 'Unknown')
+            end_date = date_range.get('end', 'Unknown')
+            total_days = data_period.get('total_days', 0)
+            available_metrics = data_period.get('available_metrics', [])
             
-            <div class="grid grid-cols-1 lg:grid-cols-2 gap-6">
-            """
+            findings = insights.get('findings', [])
+            recommendations = insights.get('recommendations', [])
             
-            for participant_id, insights in participant_insights.items():
-                data_period = insights.get('data_period', {})
-                date_range = data_period.get('date_range', {})
-                start_date = date_range.get('start', 'Unknown')
-                end_date = date_range.get('end', 'Unknown')
-                total_days = data_period.get('total_days', 0)
-                available_metrics = data_period.get('available_metrics', [])
-                
-                findings = insights.get('findings', [])
-                recommendations = insights.get('recommendations', [])
-                
-                # Generate avatar with initials
-                initials = ''.join([word[0].upper() for word in participant_id.replace('-', ' ').split()])[:2]
+            # Generate avatar with initials
+            initials = _initials(participant_id)
+            display_name = _display_name(participant_id)
+            
+            parts.append(f"""
+            <div class="bg-gradient-to-br from-blue-50 to-cyan-50 dark:from-blue-900/20 dark:to-cyan-900/20 rounded-xl p-6 hover-lift">
+                <div class="flex items-center space-x-4 mb-4">
+                    <div class="w-12 h-12 bg-gradient-to-br from-blue-500 to-cyan-500 rounded-full flex items-center justify-center">
+                        <span class="text-white font-bold text-sm">{initials}</span>
+                    </div>
+                    <div>
+                        <h3 class="text-lg font-semibold text-gray-900 dark:text-white">
+                            {display_name}
+                        </h3>
+                        <p class="text-sm text-gray-600 dark:text-gray-400">
+                            {escape(start_date)} - {escape(end_date)} ({total_days} days)
+                        </p>
+                    </div>
+                </div>
                 
-                html += f"""
-                <div class="bg-gradient-to-br from-blue-50 to-cyan-50 dark:from-blue-900/20 dark:to-cyan-900/20 rounded-xl p-6 hover-lift">
-                    <div class="flex items-center space-x-4 mb-4">
-                        <div class="w-12 h-12 bg-gradient-to-br from-blue-500 to-cyan-500 rounded-full flex items-center justify-center">
-                            <span class="text-white font-bold text-sm">{initials}</span>
-                        </div>
-                        <div>
-                            <h3 class="text-lg font-semibold text-gray-900 dark:text-white">
-                                {participant_id.replace('-', ' ').title()}
-                            </h3>
-                            <p class="text-sm text-gray-600 dark:text-gray-400">
-                                {start_date} - {end_date} ({total_days} days)
-                            </p>
-                        </div>
+                <div class="grid grid-cols-2 gap-4 mb-4">
+                    <div class="text-center">
+                        <div class="text-2xl font-bold text-blue-600">{len(findings)}</div>
+                        <div class="text-xs text-gray-600 dark:text-gray-400">Findings</div>
                     </div>
-                    
-                    <div class="grid grid-cols-2 gap-4 mb-4">
-                        <div class="text-center">
-                            <div class="text-2xl font-bold text-blue-600">{len(findings)}</div>
-                            <div class="text-xs text-gray-600 dark:text-gray-400">Findings</div>
-                        </div>
-                        <div class="text-center">
-                            <div class="text-2xl font-bold text-green-600">{len(recommendations)}</div>
-                            <div class="text-xs text-gray-600 dark:text-gray-400">Recommendations</div>
-                        </div>
+                    <div class="text-center">
+                        <div class="text-2xl font-bold text-green-600">{len(recommendations)}</div>
+                        <div class="text-xs text-gray-600 dark:text-gray-400">Recommendations</div>
                     </div>
-                    
-                    <div class="mb-4">
-                        <div class="text-xs text-gray-600 dark:text-gray-400 mb-2">Available Metrics:</div>
-                        <div class="flex flex-wrap gap-1">
-                            {' '.join([f'<span class="px-2 py-1 bg-blue-100 text-blue-800 text-xs rounded-full">{metric.title()}</span>' for metric in available_metrics])}
-                        </div>
+                </div>
+                
+                <div class="mb-4">
+                    <div class="text-xs text-gray-600 dark:text-gray-400 mb-2">Available Metrics:</div>
+                    <div class="flex flex-wrap gap-1">
+                        {' '.join(_METRIC_PILL % escape(metric.title()) for metric in available_metrics)}
                     </div>
-                    
-                    <div class="flex justify-between items-center">
-                        <div class="flex space-x-2">
-                            <span class="px-2 py-1 bg-blue-100 text-blue-800 text-xs rounded-full">
-                                Active
-                            </span>
-                            <span class="px-2 py-1 bg-green-100 text-green-800 text-xs rounded-full">
-                                Complete
-                            </span>
-                        </div>
-                        <div class="text-blue-500 hover:text-blue-600 transition-colors">
-                            {self._get_heroicon('eye', '5')}
-                        </div>
+                </div>
+                
+                <div class="flex justify-between items-center">
+                    <div class="flex space-x-2">
+                        <span class="px-2 py-1 bg-blue-100 text-blue-800 text-xs rounded-full">
+                            Active
+                        </span>
+                        <span class="px-2 py-1 bg-green-100 text-green-800 text-xs rounded-full">
+                            Complete
+                        </span>
+                    </div>
+                    <div class="text-blue-500 hover:text-blue-600 transition-colors">
+                        {self._get_heroicon('eye', '5')}
                     </div>
                 </div>
-                """
-            
-            html += """
             </div>
-            """
+            """)
         
-        html += """
+        parts.append("""
         </div>
-        """
+        """)
         
-        return html
+        parts.append("""
+        </div>
+        """)
+        
+        return "".join(parts)
     
-    def _build_participant_dashboard(self, participant_id: str, insights: Dict[str, Any], full_data: Dict[str, Any]) -> str:
+    def _build_participant_dashboard(self, participant_id: str, insights: Dict[str, Any], full_data: Dict[str, Any],
+                                     generated: str) -> str:
         """Build comprehensive individual participant dashboard with modern styling"""
         
         # Extract participant data with correct field names
@@ -1235,7 +1802,13 @@ class ModernDashboardGenerator:
         correlations = insights.get('correlations', [])
         
         # Generate avatar initials
-        initials = ''.join([word[0].upper() for word in participant_id.replace('-', ' ').split()])[:2]
+        initials = _initials(participant_id)
+        display_name = _display_name(participant_id)
+        
+        stat_cards = '\n            \n'.join(
+            card.format(value=value)
+            for card, value in zip(_STAT_CARDS, (len(findings), len(recommendations), len(available_metrics), total_days))
+        )
         
         body_content = f"""
     <!-- Header -->
@@ -1248,7 +1821,7 @@ class ModernDashboardGenerator:
                     </div>
                     <div>
                         <h1 class="text-2xl font-bold text-gray-900 dark:text-white">
-                            {participant_id.replace('-', ' ').title()}
+                            {display_name}
                         </h1>
                         <p class="text-sm text-gray-600 dark:text-gray-300">
                             Personal Health Dashboard
@@ -1258,10 +1831,10 @@ class ModernDashboardGenerator:
                 <div class="flex items-center space-x-4">
                     <div class="text-right">
                         <p class="text-sm text-gray-600 dark:text-gray-300">
-                            Period: {start_date} - {end_date} ({total_days} days)
+                            Period: {escape(start_date)} - {escape(end_date)} ({total_days} days)
                         </p>
                         <p class="text-xs text-gray-500 dark:text-gray-400">
-                            Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+                            Generated: {generated}
                         </p>
                     </div>
                 </div>
@@ -1274,69 +1847,7 @@ class ModernDashboardGenerator:
         
         <!-- Overview Stats -->
         <div class="grid grid-cols-1 md:grid-cols-4 gap-6 mb-8">
-            <div class="animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl hover-lift">
-                <div class="flex items-center justify-between">
-                    <div>
-                        <p class="text-sm font-medium text-gray-600 dark:text-gray-400">
-                            Key Findings
-                        </p>
-                        <p class="text-3xl font-bold text-blue-600 animate-stat">
-                            {len(findings)}
-                        </p>
-                    </div>
-                    <div class="text-blue-500 pulse-glow">
-                        {self._get_heroicon('sparkles', '10')}
-                    </div>
-                </div>
-            </div>
-            
-            <div class="animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl hover-lift">
-                <div class="flex items-center justify-between">
-                    <div>
-                        <p class="text-sm font-medium text-gray-600 dark:text-gray-400">
-                            Recommendations
-                        </p>
-                        <p class="text-3xl font-bold text-green-600 animate-stat">
-                            {len(recommendations)}
-                        </p>
-                    </div>
-                    <div class="text-green-500">
-                        {self._get_heroicon('check-circle', '10')}
-                    </div>
-                </div>
-            </div>
-            
-            <div class="animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl hover-lift">
-                <div class="flex items-center justify-between">
-                    <div>
-                        <p class="text-sm font-medium text-gray-600 dark:text-gray-400">
-                            Data Types
-                        </p>
-                        <p class="text-3xl font-bold text-purple-600 animate-stat">
-                            {len(available_metrics)}
-                        </p>
-                    </div>
-                    <div class="text-purple-500">
-                        {self._get_heroicon('chart-bar', '10')}
-                    </div>
-                </div>
-            </div>
-            
-            <div class="animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl hover-lift">
-                <div class="flex items-center justify-between">
-                    <div>
-                        <p class="text-sm font-medium text-gray-600 dark:text-gray-400">
-                            Monitoring Days
-                        </p>
-                        <p class="text-3xl font-bold text-orange-600 animate-stat">
-                            {total_days}
-                        </p>
-                    </div>
-                    <div class="text-orange-500">
-                        {self._get_heroicon('calendar', '10')}
-                    </div>
-                </div>
-            </div>
+{stat_cards}
         </div>
 
         <!-- Health Baselines Section -->
@@ -1373,51 +1884,25 @@ class ModernDashboardGenerator:
     </footer>
         """
         
-        return self._get_base_template().format(
-            title=f"GOQII Health Data - {participant_id.replace('-', ' ').title()}",
-            body_content=body_content
-        )
+        return self._render_page(f"GOQII Health Data - {display_name}", body_content)
     
     def _build_health_baselines_section(self, health_baselines: Dict[str, Any]) -> str:
         """Build health baselines section with detailed statistics"""
         
         if not health_baselines:
-            return f"""
-            <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
-                <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
-                    Health Baselines
-                </h2>
-                <div class="text-center py-8">
-                    <div class="text-gray-400 mb-4">
-                        {self._get_heroicon('chart-bar', '12')}
-                    </div>
-                    <p class="text-gray-600 dark:text-gray-400">
-                        No baseline data available.
-                    </p>
-                </div>
-            </div>
-            """
+            return _EMPTY_BASELINES_HTML
         
-        html = """
+        parts = ["""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
                 Health Baselines & Statistics
             </h2>
             <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-        """
-        
-        metric_icons = {
-            'sleep': ('moon', 'purple'),
-            'hr': ('heart', 'red'),
-            'temp': ('thermometer', 'orange'),
-            'bp': ('activity', 'blue'),
-            'steps': ('shoe-prints', 'green'),
-            'spo2': ('droplet', 'cyan')
-        }
+        """]
         
         for metric_name, baseline_data in health_baselines.items():
             if isinstance(baseline_data, dict):
-                icon, color = metric_icons.get(metric_name, ('chart-bar', 'gray'))
+                icon, color = _BASELINE_METRIC_ICONS.get(metric_name, ('chart-bar', 'gray'))
                 
                 count = baseline_data.get('count', 0)
                 mean = baseline_data.get('mean', 0)
@@ -1426,150 +1911,63 @@ class ModernDashboardGenerator:
                 interpretation = baseline_data.get('interpretation', 'No interpretation available')
                 normal_range = baseline_data.get('normal_range', {})
                 
-                html += f"""
-                <div class="bg-gradient-to-br from-{color}-50 to-{color}-100 dark:from-{color}-900/20 dark:to-{color}-800/20 rounded-xl p-6 hover-lift">
-                    <div class="flex items-center mb-4">
-                        <div class="text-{color}-500 mr-3">
-                            {self._get_heroicon(icon, '6')}
-                        </div>
-                        <h3 class="text-lg font-semibold text-gray-900 dark:text-white">
-                            {metric_name.replace('_', ' ').title()}
-                        </h3>
-                    </div>
-                    
-                    <div class="space-y-3 mb-4">
-                        <div class="grid grid-cols-2 gap-4">
-                            <div class="text-center">
-                                <div class="text-xl font-bold text-{color}-600">{mean:.1f}</div>
-                                <div class="text-xs text-gray-600 dark:text-gray-400">Average</div>
-                            </div>
-                            <div class="text-center">
-                                <div class="text-xl font-bold text-{color}-600">{median:.1f}</div>
-                                <div class="text-xs text-gray-600 dark:text-gray-400">Median</div>
-                            </div>
-                        </div>
-                        
-                        <div class="space-y-1 text-sm text-gray-600 dark:text-gray-400">
-                            <div class="flex justify-between">
-                                <span>Records:</span>
-                                <span class="font-medium">{count:,}</span>
-                            </div>
-                            <div class="flex justify-between">
-                                <span>Std Dev:</span>
-                                <span class="font-medium">{std:.2f}</span>
-                            </div>
-                            {f'''
-                            <div class="flex justify-between">
-                                <span>Normal Range:</span>
-                                <span class="font-medium">{normal_range.get("lower", "N/A")}-{normal_range.get("upper", "N/A")}</span>
-                            </div>
-                            ''' if normal_range else ''}
-                        </div>
-                    </div>
-                    
-                    <div class="bg-white/50 dark:bg-gray-800/50 rounded-lg p-3">
-                        <div class="text-xs font-medium text-gray-700 dark:text-gray-300 mb-1">Interpretation:</div>
-                        <div class="text-xs text-gray-600 dark:text-gray-400">{interpretation}</div>
-                    </div>
-                </div>
-                """
-        
-        html += """
+                normal_range_row = _BASELINE_RANGE_ROW.format(
+                    lower=escape(normal_range.get("lower", "N/A")), upper=escape(normal_range.get("upper", "N/A")),
+                ) if normal_range else ''
+                
+                parts.append(_BASELINE_CARD.format(
+                    tint=_CARD_CLASSES[color], icon_svg=self._get_heroicon(icon, '6'),
+                    label=escape(metric_name.replace('_', ' ').title()),
+                    mean=mean, median=median, count=count, std=std,
+                    normal_range_row=normal_range_row, interpretation=escape(interpretation),
+                ))
+        
+        parts.append("""
             </div>
         </div>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
     def _build_participant_health_metrics_section(self, available_metrics: List[str], health_baselines: Dict[str, Any]) -> str:
         """Build participant health metrics overview section"""
         
-        html = """
+        parts = ["""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
                 Your Health Metrics Overview
             </h2>
             <div class="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-6 gap-4">
-        """
-        
-        # Define all possible metrics with their display info
-        all_metrics = {
-            'steps': ('Steps', 'shoe-prints', 'green', 'avg/day'),
-            'hr': ('Heart Rate', 'heart', 'red', 'avg bpm'),
-            'sleep': ('Sleep', 'moon', 'purple', 'avg hours'),
-            'bp': ('Blood Pressure', 'activity', 'blue', 'avg mmHg'),
-            'spo2': ('SpO2', 'droplet', 'cyan', 'avg %'),
-            'temp': ('Temperature', 'thermometer', 'orange', 'avg °F')
-        }
+        """]
         
-        for metric_key, (name, icon, color, unit) in all_metrics.items():
-            is_available = metric_key in available_metrics
-            baseline_data = health_baselines.get(metric_key, {}) if is_available else {}
-            
-            if is_available and baseline_data:
-                mean_value = baseline_data.get('mean', 0)
-                
-                # Format value based on metric type
-                if metric_key == 'steps':
-                    display_value = f"{int(mean_value):,}"
-                elif metric_key == 'bp':
-                    # For BP, we might need to handle systolic/diastolic differently
-                    display_value = f"{mean_value:.0f}"
-                elif metric_key == 'temp':
-                    display_value = f"{mean_value:.1f}°F"
-                elif metric_key == 'spo2':
-                    display_value = f"{mean_value:.1f}%"
-                else:
-                    display_value = f"{mean_value:.1f}"
-                
-                opacity_class = ""
-                bg_class = f"bg-gradient-to-br from-{color}-50 to-{color}-100 dark:from-{color}-900/20 dark:to-{color}-800/20"
+        available = set(available_metrics)
+        for metric_key, (tile, unavailable_tile, format_value) in _METRIC_TILES.items():
+            baseline_data = health_baselines.get(metric_key) if metric_key in available else None
+            if baseline_data:
+                parts.append(tile.format(display_value=format_value(baseline_data.get('mean', 0))))
             else:
-                display_value = "N/A"
-                opacity_class = "opacity-50"
-                bg_class = "bg-gray-50 dark:bg-gray-800"
-            
-            html += f"""
-                <div class="{bg_class} rounded-xl p-4 text-center hover-lift {opacity_class}">
-                    <div class="text-{color}-500 mb-2 flex justify-center">
-                        {self._get_heroicon(icon, '8')}
-                    </div>
-                    <div class="text-2xl font-bold text-gray-900 dark:text-white mb-1">
-                        {display_value}
-                    </div>
-                    <div class="text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">
-                        {name}
-                    </div>
-                    <div class="text-xs text-gray-500 dark:text-gray-400">
-                        {unit}
-                    </div>
-                </div>
-            """
+                parts.append(unavailable_tile)
         
-        html += """
+        parts.append("""
             </div>
         </div>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
     def _build_participant_correlations_section(self, correlations: List[Dict[str, Any]]) -> str:
         """Build comprehensive participant correlations section showing all correlation analyses"""
         
         # Load actual correlation analysis data if available
         try:
-            import json
-            import os
-            correlation_file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'processed', 'correlation_analysis.json')
-            if os.path.exists(correlation_file_path):
-                with open(correlation_file_path, 'r') as f:
-                    detailed_correlation_data = json.load(f)
-                # Extract participant-1 data
-                participant_correlations = detailed_correlation_data.get('participant-1', {}).get('daily_correlations', {})
-            else:
-                participant_correlations = {}
-        except:
-            participant_correlations = {}
+            detailed_correlation_data = _load_correlation_file(_CORRELATION_FILE_PATH)
+        except FileNotFoundError:
+            detailed_correlation_data = {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load {_CORRELATION_FILE_PATH}, using in-memory correlations: {e}")
+            detailed_correlation_data = {}
+        # Extract participant-1 data
+        participant_correlations = detailed_correlation_data.get('participant-1', {}).get('daily_correlations', {})
         
         # If no detailed data available, fall back to provided correlations
         if not participant_correlations and isinstance(correlations, list):
@@ -1579,7 +1977,7 @@ class ModernDashboardGenerator:
                 if isinstance(corr, dict):
                     participant_correlations[f"correlation_{i}"] = corr
         
-        html = f"""
+        parts = [f"""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <div class="flex items-center mb-6">
                 <div class="text-purple-500 mr-3">
@@ -1595,29 +1993,23 @@ class ModernDashboardGenerator:
                     These correlations show how your different health metrics relate to each other. All analyses performed are shown below for complete transparency.
                 </p>
             </div>
-        """
+        """]
         
         if not participant_correlations:
-            html += f"""
-            <div class="text-center py-8">
-                <div class="text-gray-400 mb-4">
-                    {self._get_heroicon('link', '12')}
-                </div>
-                <p class="text-gray-600 dark:text-gray-400">
-                    No correlation analysis data available for your health metrics.
-                </p>
-            </div>
-        """
+            parts.append(_NO_PARTICIPANT_CORRELATIONS_HTML)
         else:
             # Calculate summary statistics
             total_tests = len(participant_correlations)
-            significant_count = sum(1 for corr in participant_correlations.values() 
-                                  if corr.get('pearson', {}).get('significant') == 'True' or 
-                                     corr.get('spearman', {}).get('significant') == 'True')
-            potential_trends = sum(1 for corr in participant_correlations.values() 
-                                 if corr.get('confidence') in ['might be a thing', 'pretty sure'])
+            significant_count = potential_trends = 0
+            for corr in participant_correlations.values():
+                if ((corr.get('pearson') or _NO_STATS).get('significant') == 'True' or
+                        (corr.get('spearman') or _NO_STATS).get('significant') == 'True'):
+                    significant_count += 1
+                if corr.get('confidence') in _TREND_CONFIDENCE_LEVELS:
+                    potential_trends += 1
+            success_rate = f"{significant_count / total_tests * 100:.0f}%" if total_tests else "0%"
             
-            html += f"""
+            parts.append(f"""
             <!-- Summary Statistics -->
             <div class="grid grid-cols-2 md:grid-cols-4 gap-4 mb-8">
                 <div class="bg-blue-50 dark:bg-blue-900/20 rounded-lg p-4 text-center">
@@ -1633,26 +2025,22 @@ class ModernDashboardGenerator:
                     <div class="text-sm text-gray-600 dark:text-gray-400">Potential Patterns</div>
                 </div>
                 <div class="bg-purple-50 dark:bg-purple-900/20 rounded-lg p-4 text-center">
-                    <div class="text-2xl font-bold text-purple-600">{significant_count/total_tests*100 if total_tests > 0 else 0:.0f}%</div>
+                    <div class="text-2xl font-bold text-purple-600">{success_rate}</div>
                     <div class="text-sm text-gray-600 dark:text-gray-400">Success Rate</div>
                 </div>
             </div>
             
             <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-            """
+            """)
             
             # Sort correlations by absolute correlation strength
-            sorted_correlations = sorted(
-                participant_correlations.items(),
-                key=lambda x: abs(x[1].get('pearson', {}).get('r', 0)),
-                reverse=True
-            )
+            sorted_correlations = sorted(participant_correlations.items(), key=_abs_pearson_r, reverse=True)
             
             for correlation_name, correlation_data in sorted_correlations:
                 # Use the same correlation card builder as the research dashboard
-                html += self._build_correlation_card(correlation_name, correlation_data)
+                parts.append(self._build_correlation_card(correlation_name, correlation_data))
             
-            html += """
+            parts.append("""
             </div>
             
             <!-- Personal Insights -->
@@ -1667,41 +2055,27 @@ class ModernDashboardGenerator:
                     <p>• Use these insights alongside professional medical advice for the best health outcomes.</p>
                 </div>
             </div>
-            """
+            """)
         
-        html += """
+        parts.append("""
         </div>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
     def _build_findings_section(self, findings: List[Dict[str, Any]]) -> str:
         """Build the key findings section"""
         
         if not findings:
-            return f"""
-            <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
-                <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
-                    Key Findings
-                </h2>
-                <div class="text-center py-8">
-                    <div class="text-gray-400 mb-4">
-                        {self._get_heroicon('sparkles', '12')}
-                    </div>
-                    <p class="text-gray-600 dark:text-gray-400">
-                        No significant findings identified.
-                    </p>
-                </div>
-            </div>
-            """
+            return _EMPTY_FINDINGS_HTML
         
-        html = """
+        parts = ["""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
                 Key Findings
             </h2>
             <div class="space-y-4">
-        """
+        """]
         
         for i, finding in enumerate(findings):
             title = finding.get('title', f'Finding {i+1}')
@@ -1718,138 +2092,140 @@ class ModernDashboardGenerator:
                 color_class = "blue"
                 icon = "sparkles"
             
-            html += f"""
-                <div class="bg-gradient-to-r from-{color_class}-50 to-{color_class}-100 dark:from-{color_class}-900/20 dark:to-{color_class}-800/20 rounded-xl p-4 hover-lift">
-                    <div class="flex items-start space-x-3">
-                        <div class="text-{color_class}-500 mt-1">
-                            {self._get_heroicon(icon, '5')}
-                        </div>
-                        <div class="flex-1">
-                            <h3 class="font-semibold text-gray-900 dark:text-white mb-1">
-                                {title}
-                            </h3>
-                            <p class="text-sm text-gray-600 dark:text-gray-400">
-                                {description}
-                            </p>
-                            <span class="inline-block mt-2 px-2 py-1 bg-{color_class}-100 text-{color_class}-800 text-xs rounded-full">
-                                {priority.title()} Priority
-                            </span>
-                        </div>
-                    </div>
-                </div>
-            """
+            parts.append(_FINDING_CARD.format(
+                tint=_CARD_CLASSES[color_class], icon_svg=self._get_heroicon(icon, '5'),
+                title=escape(title), description=escape(description), priority_label=escape(priority.title()),
+            ))
         
-        html += """
+        parts.append("""
             </div>
         </div>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
     def _build_recommendations_section(self, recommendations: List[Dict[str, Any]]) -> str:
         """Build the recommendations section"""
         
         if not recommendations:
-            return f"""
-            <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
-                <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-4">
-                    Health Recommendations
-                </h2>
-                <div class="text-center py-8">
-                    <div class="text-gray-400 mb-4">
-                        {self._get_heroicon('check-circle', '12')}
-                    </div>
-                    <p class="text-gray-600 dark:text-gray-400">
-                        No specific recommendations at this time.
-                    </p>
-                </div>
-            </div>
-            """
+            return _EMPTY_RECOMMENDATIONS_HTML
         
-        html = """
+        parts = ["""
         <div class="mb-8 animate-card bg-white/80 dark:bg-gray-800/80 backdrop-blur-sm rounded-2xl p-6 shadow-xl">
             <h2 class="text-2xl font-bold text-gray-900 dark:text-white mb-6">
                 Health Recommendations
             </h2>
             <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
-        """
+        """]
         
         for i, recommendation in enumerate(recommendations):
             title = recommendation.get('title', f'Recommendation {i+1}')
             description = recommendation.get('description', 'No description available')
             category = recommendation.get('category', 'general').lower()
             
-            # Map categories to colors and icons
-            category_map = {
-                'exercise': ('green', 'shoe-prints'),
-                'sleep': ('purple', 'moon'),
-                'diet': ('orange', 'heart'),
-                'general': ('blue', 'sparkles'),
-                'medical': ('red', 'beaker')
-            }
+            color_class, icon = _RECOMMENDATION_CATEGORIES.get(category, ('blue', 'sparkles'))
             
-            color_class, icon = category_map.get(category, ('blue', 'sparkles'))
-            
-            html += f"""
-                <div class="bg-gradient-to-br from-{color_class}-50 to-{color_class}-100 dark:from-{color_class}-900/20 dark:to-{color_class}-800/20 rounded-xl p-4 hover-lift">
-                    <div class="flex items-start space-x-3">
-                        <div class="text-{color_class}-500 mt-1">
-                            {self._get_heroicon(icon, '6')}
-                        </div>
-                        <div class="flex-1">
-                            <h3 class="font-semibold text-gray-900 dark:text-white mb-2">
-                                {title}
-                            </h3>
-                            <p class="text-sm text-gray-600 dark:text-gray-400 mb-3">
-                                {description}
-                            </p>
-                            <div class="flex justify-between items-center">
-                                <span class="px-2 py-1 bg-{color_class}-100 text-{color_class}-800 text-xs rounded-full">
-                                    {category.title()}
-                                </span>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            """
+            parts.append(_RECOMMENDATION_CARD.format(
+                tint=_CARD_CLASSES[color_class], icon_svg=self._get_heroicon(icon, '6'),
+                title=escape(title), description=escape(description), category_label=escape(category.title()),
+            ))
         
-        html += """
+        parts.append("""
             </div>
         </div>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
 
 
 
+def _render_participant_job(job: Tuple[str, Dict[str, Any], str]) -> Tuple[str, str]:
+    """Process-pool worker: render one participant dashboard"""
+    participant_id, insights, generated = job
+    # The participant builder never reads full_data, so it is not shipped to workers
+    html = ModernDashboardGenerator()._build_participant_dashboard(participant_id, insights, {}, generated)
+    return participant_id, html
+
+
+# Page writes are I/O bound, so a few threads overlap the open/write/close latency
+_WRITE_WORKERS = 8
+
+# Streaming mode keeps at most this many rendered pages queued for writing
+_MAX_PENDING_WRITES = 2 * _WRITE_WORKERS
+
+
+def _write_page(path: Path, html: str) -> Path:
+    """Write one rendered page as pre-encoded UTF-8, skipping the text-mode layer"""
+    path.write_bytes(html.encode('utf-8'))
+    return path
+
+
 # Integration function to generate dashboards
-def generate_modern_dashboards(analysis_results: Dict[str, Any], output_dir: Optional[Path] = None) -> Dict[str, Any]:
+def generate_modern_dashboards(analysis_results: Dict[str, Any], output_dir: Optional[Path] = None,
+                               keep_html: bool = True) -> Dict[str, Any]:
     """
     Generate modern dashboards using Tailwind CSS, Heroicons, and anime.js
+    
+    With ``keep_html=False`` (requires ``output_dir``) each page is written to disk as
+    soon as it is rendered and the returned mapping holds file paths instead of HTML.
+    Only a bounded window of pages is held at once (queued writes plus the render
+    pool's in-flight chunks), however large the cohort.
     """
     generator = ModernDashboardGenerator()
-    dashboards = generator.process(analysis_results)
     
-    if output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Save researcher dashboard
-        researcher_file = output_dir / "researcher-dashboard.html"
-        with open(researcher_file, 'w', encoding='utf-8') as f:
-            f.write(dashboards['researcher'])
-        
-        # Save participant dashboards
-        participant_dir = output_dir / "participant-dashboards"
-        participant_dir.mkdir(exist_ok=True)
-        
-        for participant_id, html in dashboards['participants'].items():
-            participant_file = participant_dir / f"{participant_id}.html"
-            with open(participant_file, 'w', encoding='utf-8') as f:
-                f.write(html)
+    if keep_html:
+        dashboards = generator.process(analysis_results)
+        
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Save researcher dashboard
+            _write_page(output_dir / "researcher-dashboard.html", dashboards['researcher'])
+            
+            # Save participant dashboards
+            participant_dir = output_dir / "participant-dashboards"
+            participant_dir.mkdir(exist_ok=True)
+            
+            participants = dashboards['participants']
+            with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as writer:
+                # Draining map re-raises the first failed write
+                list(writer.map(_write_page,
+                                [participant_dir / f"{participant_id}.html" for participant_id in participants],
+                                participants.values()))
+        
+        return dashboards
+    
+    if output_dir is None:
+        raise ValueError("keep_html=False needs an output_dir to stream dashboards into")
     
-    return dashboards
-
+    generator.logger.info("Generating modern HTML dashboards with Tailwind CSS")
+    generated_at = datetime.now()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    participant_dir = output_dir / "participant-dashboards"
+    participant_dir.mkdir(exist_ok=True)
+    
+    researcher_file = _write_page(output_dir / "researcher-dashboard.html",
+                                  generator._build_researcher_dashboard(analysis_results, generated_at))
+    
+    # Rendering carries on while earlier pages are still being written, but only
+    # a window of writes is queued, so rendered pages cannot pile up in memory
+    participant_files = {}
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as writer:
+        pending = deque()
+        for participant_id, html in generator._render_participant_dashboards(analysis_results, generated_at):
+            if len(pending) >= _MAX_PENDING_WRITES:
+                written_id, write = pending.popleft()
+                participant_files[written_id] = write.result()
+            pending.append((participant_id,
+                            writer.submit(_write_page, participant_dir / f"{participant_id}.html", html)))
+        for written_id, write in pending:
+            participant_files[written_id] = write.result()
+    
+    return {
+        'researcher': researcher_file,
+        'participants': participant_files
+    }
 
 if __name__ == "__main__":
     # Example usage
@@ -10,14 +10,139 @@ Generates personalized health insights including:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 from datetime import datetime, timedelta
 import json
+import math
+import operator
+from bisect import bisect_right
+from functools import partial
 from pathlib import Path
-from scipy import stats
 import warnings
 
-from .core import HealthDataRecord, HealthDataCollection, BaseProcessor
+from .core import HealthDataRecord, HealthDataCollection, BaseProcessor, map_participant_jobs, records_to_columns
+
+
+# Weekday names indexed by datetime.weekday(); fixed English names because the
+# insight text compares against them
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Clinical interpretation bands: metric -> (ascending thresholds, labels).
+# bisect_right puts a mean equal to a threshold in the band above it; the
+# inclusive upper bounds of the temp/sleep normal ranges are nudged one ulp up.
+_BASELINE_INTERPRETATIONS = {
+    'bp': ((120, 130, 140), (
+        "Normal blood pressure range",
+        "Elevated blood pressure",
+        "Stage 1 hypertension range",
+        "Stage 2 hypertension range",
+    )),
+    'hr': ((60, 100), (
+        "Below normal resting heart rate (bradycardia)",
+        "Normal resting heart rate",
+        "Elevated resting heart rate (tachycardia)",
+    )),
+    'spo2': ((90, 95), (
+        "Low oxygen saturation",
+        "Borderline oxygen saturation",
+        "Normal oxygen saturation",
+    )),
+    'temp': ((97.0, math.nextafter(99.0, math.inf)), (
+        "Slightly low temperature",
+        "Normal body temperature",
+        "Slightly elevated temperature",
+    )),
+    'sleep': ((7, math.nextafter(9, math.inf)), (
+        "Below recommended sleep duration",
+        "Optimal sleep duration",
+        "Above typical sleep duration",
+    )),
+    'steps': ((5000, 7500, 10000), (
+        "Sedentary lifestyle",
+        "Somewhat active lifestyle",
+        "Moderately active lifestyle",
+        "Highly active lifestyle",
+    )),
+}
+
+# Baseline-driven recommendations: metric -> (comparison, threshold, template).
+# Only 'recommendation' varies per participant (formatted with the metric mean);
+# the rest, including the immutable action items, is shared across participants.
+_BASELINE_RECOMMENDATIONS = {
+    'bp': (operator.ge, 130, {
+        'category': 'Blood Pressure',
+        'priority': 'High',
+        'recommendation': 'Consider discussing your elevated blood pressure with a healthcare provider',
+        'action_items': (
+            'Reduce sodium intake to less than 2,300mg daily',
+            'Increase physical activity to 150 minutes per week',
+            'Monitor blood pressure regularly',
+        ),
+        'target': 'Reduce average to below 120 mmHg'
+    }),
+    'steps': (operator.lt, 7500, {
+        'category': 'Physical Activity',
+        'priority': 'Medium',
+        'recommendation': 'Increase daily activity from current {mean:,.0f} steps',
+        'action_items': (
+            'Set a goal of 500 additional steps per week',
+            'Take stairs instead of elevators',
+            'Park further away or get off transit one stop early',
+            'Take 5-minute walking breaks every hour',
+        ),
+        'target': 'Reach 10,000 steps daily'
+    }),
+    'sleep': (operator.lt, 7, {
+        'category': 'Sleep Quality',
+        'priority': 'High',
+        'recommendation': 'Increase sleep duration from current {mean} hours',
+        'action_items': (
+            'Set a consistent bedtime 30 minutes earlier',
+            'Create a relaxing bedtime routine',
+            'Avoid screens 1 hour before bed',
+            'Keep bedroom cool and dark',
+        ),
+        'target': 'Achieve 7-9 hours of sleep nightly'
+    }),
+}
+
+_LIFESTYLE_SYNERGY_RECOMMENDATION = {
+    'category': 'Lifestyle Synergy',
+    'priority': 'Medium',
+    'recommendation': 'Your activity and sleep are positively connected',
+    'action_items': (
+        'Maintain consistent exercise routine for better sleep',
+        'Aim for morning or afternoon workouts',
+        'Track both metrics to optimize the relationship',
+    ),
+    'target': 'Leverage exercise for improved sleep quality'
+}
+
+# Key for picking the (key, value) pair with the extreme value from dict.items()
+_by_value = operator.itemgetter(1)
+
+# Sort rank for recommendation priorities (higher first)
+_PRIORITY_RANK = {'High': 3, 'Medium': 2, 'Low': 1}
+
+
+def _priority_rank(recommendation: Dict) -> int:
+    """Sort key for recommendations by priority"""
+    return _PRIORITY_RANK.get(recommendation['priority'], 0)
+
+
+def _binned_means(bins: np.ndarray, values: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean of values per integer bin (0..size-1) via np.bincount.
+    
+    Bins with fewer than two values are dropped. Returns (bin ids, means)
+    with bins in the order they first appear in ``bins``.
+    """
+    counts = np.bincount(bins, minlength=size)
+    sums = np.bincount(bins, weights=values, minlength=size)
+    seen, first_index = np.unique(bins, return_index=True)
+    ids = seen[np.argsort(first_index)]
+    ids = ids[counts[ids] >= 2]
+    return ids, sums[ids] / counts[ids]
 
 
 class HealthBaselineAnalyzer(BaseProcessor):
@@ -25,74 +150,83 @@ class HealthBaselineAnalyzer(BaseProcessor):
     Analyzes individual health baselines and normal ranges.
     """
     
-    def process(self, participant_data: List[HealthDataRecord]) -> Dict:
+    def process(self, participant_data: Union[Dict[str, np.ndarray], List[HealthDataRecord]]) -> Dict:
         """
         Analyze health baseline for a single participant.
         
         Parameters
         ----------
-        participant_data : List[HealthDataRecord]
-            All health records for one participant
+        participant_data : Dict[str, np.ndarray] or List[HealthDataRecord]
+            All health records for one participant, as columns from
+            HealthDataCollection.as_columns or as a list of records
             
         Returns
         -------
         Dict
             Health baseline analysis
         """
-        good_data = [r for r in participant_data if r.quality_flag == 'good']
+        columns = participant_data
+        if not isinstance(columns, dict):
+            columns = records_to_columns(participant_data)
+        
+        good = columns['quality_flag'] == 'good'
         
-        if not good_data:
+        if not good.any():
             return {}
         
         baselines = {}
+        metric_types = columns['metric_type']
         
-        # Group by metric type
-        by_metric = {}
-        for record in good_data:
-            if record.metric_type not in by_metric:
-                by_metric[record.metric_type] = []
-            by_metric[record.metric_type].append(record)
-        
-        for metric_type, records in by_metric.items():
-            if len(records) < 3:  # Need minimum data
+        # Metrics in first-seen order, each selected with a boolean mask
+        for metric_type in pd.unique(metric_types[good]):
+            rows = np.flatnonzero(good & (metric_types == metric_type))
+            if len(rows) < 3:  # Need minimum data
                 continue
             
-            values = [r.value_1 for r in records]
+            values = columns['value_1'][rows]
             baseline = self._compute_baseline_stats(values, metric_type)
             
             # Add secondary value analysis if available
-            if records[0].value_2 is not None:
-                secondary_values = [r.value_2 for r in records if r.value_2 is not None]
-                if secondary_values:
+            has_secondary = columns['has_value_2'][rows]
+            if has_secondary[0]:
+                secondary_values = columns['value_2'][rows][has_secondary]
+                if secondary_values.size:
                     baseline['secondary'] = self._compute_baseline_stats(
                         secondary_values, 
                         f"{metric_type}_secondary"
                     )
             
             # Add temporal patterns
-            baseline['temporal_patterns'] = self._analyze_temporal_patterns(records)
+            baseline['temporal_patterns'] = self._analyze_temporal_patterns(
+                values, columns['hour'][rows], columns['weekday'][rows]
+            )
             
             baselines[metric_type] = baseline
         
         return baselines
     
-    def _compute_baseline_stats(self, values: List[float], metric_type: str) -> Dict:
+    def _compute_baseline_stats(self, values: np.ndarray, metric_type: str) -> Dict:
         """Compute baseline statistics for a metric"""
         
-        values_array = np.array(values)
+        # One sort covers the median and every percentile
+        percentiles = np.percentile(values, [10, 25, 50, 75, 90])
+        
+        # Round in NumPy, then hand back native floats so the result
+        # serializes without any per-value fallback
+        mean, p10, p25, p50, p75, p90 = np.round(np.append(values.mean(), percentiles), 1).tolist()
         
         baseline = {
             'count': len(values),
-            'mean': round(np.mean(values_array), 1),
-            'median': round(np.median(values_array), 1),
-            'std': round(np.std(values_array), 2),
+            'mean': mean,
+            'median': p50,
+            'std': float(round(values.std(), 2)),
             'normal_range': {
-                'lower': round(np.percentile(values_array, 10), 1),  # 10th percentile
-                'upper': round(np.percentile(values_array, 90), 1),  # 90th percentile
+                'lower': p10,  # 10th percentile
+                'upper': p90,  # 90th percentile
             },
             'percentiles': {
-                'p25': round(np.percentile(values_array, 25), 1),
-                'p75': round(np.percentile(values_array, 75), 1),
+                'p25': p25,
+                'p75': p75,
             }
         }
         
@@ -101,39 +235,29 @@ class HealthBaselineAnalyzer(BaseProcessor):
         
         return baseline
     
-    def _analyze_temporal_patterns(self, records: List[HealthDataRecord]) -> Dict:
+    def _analyze_temporal_patterns(self, values: np.ndarray, hours: np.ndarray,
+                                   weekdays: np.ndarray) -> Dict:
         """Analyze temporal patterns in the data"""
         
-        # Group by hour of day
-        hourly_data = {}
-        for record in records:
-            hour = record.datetime.hour
-            if hour not in hourly_data:
-                hourly_data[hour] = []
-            hourly_data[hour].append(record.value_1)
-        
-        # Find peak hours
-        hourly_means = {hour: np.mean(values) for hour, values in hourly_data.items() if len(values) >= 2}
-        
-        peak_hour = max(hourly_means, key=hourly_means.get) if hourly_means else None
-        low_hour = min(hourly_means, key=hourly_means.get) if hourly_means else None
+        # Mean per hour of day, for hours with at least two readings
+        hour_ids, hourly_means = _binned_means(hours, values, 24)
         
-        # Group by day of week
-        daily_data = {}
-        for record in records:
-            day = record.datetime.strftime('%A')
-            if day not in daily_data:
-                daily_data[day] = []
-            daily_data[day].append(record.value_1)
+        # Find peak hours; argmax/argmin keep the first hour seen on ties
+        peak_hour = low_hour = None
+        if hour_ids.size:
+            peak, low = hourly_means.argmax(), hourly_means.argmin()
+            peak_hour, low_hour = int(hour_ids[peak]), int(hour_ids[low])
         
-        daily_means = {day: np.mean(values) for day, values in daily_data.items() if len(values) >= 2}
+        # Mean per day of week
+        day_ids, day_means = _binned_means(weekdays, values, 7)
+        daily_means = {_DAY_NAMES[day]: mean for day, mean in zip(day_ids.tolist(), day_means.tolist())}
         
         return {
             'hourly_patterns': {
                 'peak_hour': peak_hour,
-                'peak_value': round(hourly_means[peak_hour], 1) if peak_hour else None,
+                'peak_value': float(round(hourly_means[peak], 1)) if peak_hour else None,
                 'low_hour': low_hour,
-                'low_value': round(hourly_means[low_hour], 1) if low_hour else None,
+                'low_value': float(round(hourly_means[low], 1)) if low_hour else None,
             },
             'weekly_patterns': daily_means,
         }
@@ -141,62 +265,12 @@ class HealthBaselineAnalyzer(BaseProcessor):
     def _interpret_baseline(self, baseline: Dict, metric_type: str) -> str:
         """Provide clinical interpretation of baseline values"""
         
-        mean_val = baseline['mean']
-        
-        if metric_type == 'bp':
-            if mean_val < 120:
-                return "Normal blood pressure range"
-            elif mean_val < 130:
-                return "Elevated blood pressure"
-            elif mean_val < 140:
-                return "Stage 1 hypertension range"
-            else:
-                return "Stage 2 hypertension range"
-        
-        elif metric_type == 'hr':
-            if mean_val < 60:
-                return "Below normal resting heart rate (bradycardia)"
-            elif mean_val < 100:
-                return "Normal resting heart rate"
-            else:
-                return "Elevated resting heart rate (tachycardia)"
-        
-        elif metric_type == 'spo2':
-            if mean_val >= 95:
-                return "Normal oxygen saturation"
-            elif mean_val >= 90:
-                return "Borderline oxygen saturation"
-            else:
-                return "Low oxygen saturation"
-        
-        elif metric_type == 'temp':
-            if 97.0 <= mean_val <= 99.0:
-                return "Normal body temperature"
-            elif mean_val > 99.0:
-                return "Slightly elevated temperature"
-            else:
-                return "Slightly low temperature"
-        
-        elif metric_type == 'sleep':
-            if 7 <= mean_val <= 9:
-                return "Optimal sleep duration"
-            elif mean_val < 7:
-                return "Below recommended sleep duration"
-            else:
-                return "Above typical sleep duration"
-        
-        elif metric_type == 'steps':
-            if mean_val >= 10000:
-                return "Highly active lifestyle"
-            elif mean_val >= 7500:
-                return "Moderately active lifestyle"
-            elif mean_val >= 5000:
-                return "Somewhat active lifestyle"
-            else:
-                return "Sedentary lifestyle"
-        
-        else:
+        bands = _BASELINE_INTERPRETATIONS.get(metric_type)
+        if bands is None:
             return "Within measured range"
+        
+        thresholds, labels = bands
+        return labels[bisect_right(thresholds, baseline['mean'])]
 
 
 class PersonalizedInsightsGenerator(BaseProcessor):
@@ -269,7 +343,6 @@ class PersonalizedInsightsGenerator(BaseProcessor):
         
         # Baseline findings
         for metric, baseline in baselines.items():
-            interpretation = baseline.get('interpretation', '')
             mean_val = baseline['mean']
             
             if metric == 'bp' and mean_val >= 130:
@@ -285,12 +358,13 @@ class PersonalizedInsightsGenerator(BaseProcessor):
         
         # Correlation findings
         for correlation_name, corr_data in correlations.items():
-            if corr_data.get('pearson', {}).get('significant', False):
-                r_value = corr_data['pearson']['r']
+            pearson = corr_data.get('pearson') or {}
+            if pearson.get('significant', False):
+                r_value = pearson['r']
                 confidence = corr_data.get('confidence', 'uncertain')
                 
                 if abs(r_value) >= 0.5 and confidence in ['solid', 'pretty sure']:
-                    metric1, metric2 = correlation_name.replace('_vs_', ' and ').split(' and ')
+                    metric1, _, metric2 = correlation_name.partition('_vs_')
                     direction = "positively" if r_value > 0 else "negatively"
                     findings.append(f"Strong relationship found: your {metric1} and {metric2} are {direction} correlated (r={r_value:.2f})")
         
@@ -331,22 +405,17 @@ class PersonalizedInsightsGenerator(BaseProcessor):
         
         # Lag effect insights
         for lag_name, lag_data in lag_correlations.items():
-            if lag_data.get('pearson', {}).get('significant', False):
-                interpretation = lag_data.get('interpretation', '')
-                confidence = lag_data.get('confidence', '')
-                
-                if confidence in ['solid', 'pretty sure']:
-                    insights.append(interpretation)
+            if (lag_data.get('pearson') or {}).get('significant', False):
+                if lag_data.get('confidence', '') in ['solid', 'pretty sure']:
+                    insights.append(lag_data.get('interpretation', ''))
         
         # Weekly pattern insights
         for metric, baseline in baselines.items():
             weekly = baseline.get('temporal_patterns', {}).get('weekly_patterns', {})
             
             if len(weekly) >= 5:  # Have data for most days
-                max_day = max(weekly, key=weekly.get)
-                min_day = min(weekly, key=weekly.get)
-                max_val = weekly[max_day]
-                min_val = weekly[min_day]
+                max_day, max_val = max(weekly.items(), key=_by_value)
+                min_day, min_val = min(weekly.items(), key=_by_value)
                 
                 if metric == 'steps':
                     insights.append(f"You're most active on {max_day}s ({max_val:,.0f} steps) and least active on {min_day}s ({min_val:,.0f} steps)")
@@ -366,65 +435,24 @@ class PersonalizedInsightsGenerator(BaseProcessor):
         
         # Baseline-based recommendations
         for metric, baseline in baselines.items():
-            mean_val = baseline['mean']
-            
-            if metric == 'bp' and mean_val >= 130:
-                recommendations.append({
-                    'category': 'Blood Pressure',
-                    'priority': 'High',
-                    'recommendation': 'Consider discussing your elevated blood pressure with a healthcare provider',
-                    'action_items': [
-                        'Reduce sodium intake to less than 2,300mg daily',
-                        'Increase physical activity to 150 minutes per week',
-                        'Monitor blood pressure regularly',
-                    ],
-                    'target': 'Reduce average to below 120 mmHg'
-                })
-            
-            elif metric == 'steps' and mean_val < 7500:
-                recommendations.append({
-                    'category': 'Physical Activity',
-                    'priority': 'Medium',
-                    'recommendation': f'Increase daily activity from current {mean_val:,.0f} steps',
-                    'action_items': [
-                        'Set a goal of 500 additional steps per week',
-                        'Take stairs instead of elevators',
-                        'Park further away or get off transit one stop early',
-                        'Take 5-minute walking breaks every hour',
-                    ],
-                    'target': 'Reach 10,000 steps daily'
-                })
+            rule = _BASELINE_RECOMMENDATIONS.get(metric)
+            if rule is None:
+                continue
             
-            elif metric == 'sleep' and mean_val < 7:
+            compare, threshold, template = rule
+            mean_val = baseline['mean']
+            if compare(mean_val, threshold):
                 recommendations.append({
-                    'category': 'Sleep Quality',
-                    'priority': 'High',
-                    'recommendation': f'Increase sleep duration from current {mean_val} hours',
-                    'action_items': [
-                        'Set a consistent bedtime 30 minutes earlier',
-                        'Create a relaxing bedtime routine',
-                        'Avoid screens 1 hour before bed',
-                        'Keep bedroom cool and dark',
-                    ],
-                    'target': 'Achieve 7-9 hours of sleep nightly'
+                    **template,
+                    'recommendation': template['recommendation'].format(mean=mean_val),
                 })
         
         # Correlation-based recommendations
-        steps_sleep_corr = correlations.get('steps_vs_sleep', {})
-        if steps_sleep_corr.get('pearson', {}).get('significant', False):
-            r_value = steps_sleep_corr['pearson']['r']
+        steps_sleep_pearson = correlations.get('steps_vs_sleep', {}).get('pearson') or {}
+        if steps_sleep_pearson.get('significant', False):
+            r_value = steps_sleep_pearson['r']
             if r_value > 0.3:
-                recommendations.append({
-                    'category': 'Lifestyle Synergy',
-                    'priority': 'Medium',
-                    'recommendation': 'Your activity and sleep are positively connected',
-                    'action_items': [
-                        'Maintain consistent exercise routine for better sleep',
-                        'Aim for morning or afternoon workouts',
-                        'Track both metrics to optimize the relationship',
-                    ],
-                    'target': 'Leverage exercise for improved sleep quality'
-                })
+                recommendations.append(dict(_LIFESTYLE_SYNERGY_RECOMMENDATION))
         
         # Anomaly-based recommendations
         for metric, anomaly_data in anomalies.items():
@@ -444,8 +472,7 @@ class PersonalizedInsightsGenerator(BaseProcessor):
                 })
         
         # Sort by priority
-        priority_order = {'High': 3, 'Medium': 2, 'Low': 1}
-        recommendations.sort(key=lambda x: priority_order.get(x['priority'], 0), reverse=True)
+        recommendations.sort(key=_priority_rank, reverse=True)
         
         return recommendations
     
@@ -475,15 +502,10 @@ class PersonalizedInsightsGenerator(BaseProcessor):
         # Analyze anomaly patterns
         recent_anomalies = []
         for metric, anomaly_data in anomalies.items():
-            anomaly_dates = anomaly_data.get('anomaly_dates', [])
-            if anomaly_dates:
-                # Check if recent anomalies (last 7 days of data)
-                recent_count = 0
-                for date_str in anomaly_dates[-7:]:  # Last few dates
-                    recent_count += 1
-                
-                if recent_count > 0:
-                    recent_anomalies.append(f"{recent_count} recent {metric} anomalies")
+            # Recent anomalies: up to the last 7 anomaly dates
+            recent_count = min(len(anomaly_data.get('anomaly_dates', [])), 7)
+            if recent_count:
+                recent_anomalies.append(f"{recent_count} recent {metric} anomalies")
         
         if recent_anomalies:
             progress['concerning_trends'].extend(recent_anomalies)
@@ -517,42 +539,31 @@ class ParticipantInsightPipeline(BaseProcessor):
     Complete pipeline for generating participant insights.
     """
     
-    def process(self, data: Tuple[HealthDataCollection, str]) -> Dict:
+    def process(self, data: Tuple[Dict[str, np.ndarray], str, Dict]) -> Dict:
         """
         Generate complete participant insights.
         
         Parameters
         ----------
-        data : Tuple[HealthDataCollection, str]
-            (health_data_collection, participant_id)
+        data : Tuple[Dict[str, np.ndarray], str, Dict]
+            (participant_columns, participant_id, participant_correlations), where
+            participant_columns comes from HealthDataCollection.as_columns
             
         Returns
         -------
         Dict
             Complete participant insights
         """
-        collection, participant_id = data
-        participant_data = collection.get_participant_data(participant_id)
+        participant_columns, participant_id, participant_correlations = data
         
-        if not participant_data:
+        if not len(participant_columns['value_1']):
             return {}
         
         self.logger.info(f"Generating insights for {participant_id}")
         
         # Generate baseline analysis
         baseline_analyzer = HealthBaselineAnalyzer()
-        baselines = baseline_analyzer.process(participant_data)
-        
-        # Load correlation analysis if available
-        from .correlation_engine import CorrelationEngine
-        corr_engine = CorrelationEngine()
-        
-        # Create mini collection for this participant
-        participant_collection = HealthDataCollection()
-        participant_collection.add_records(participant_data)
-        
-        corr_results = corr_engine.process(participant_collection)
-        participant_correlations = corr_results.get(participant_id, {})
+        baselines = baseline_analyzer.process(participant_columns)
         
         # Combine analysis data
         combined_data = {
@@ -582,9 +593,35 @@ class ParticipantInsightPipeline(BaseProcessor):
         return result
 
 
+# Insight generation is heavy per participant, so the pool pays off for smaller cohorts
+_PARALLEL_MIN_PARTICIPANTS = 50
+
+
+def _generate_participant_job(
+    job: Tuple[Dict[str, np.ndarray], str, Dict, Optional[Path]],
+    pipeline: Optional[ParticipantInsightPipeline] = None
+) -> Tuple[str, Dict]:
+    """Generate (and save, if an output directory is given) one participant's insights"""
+    participant_columns, participant_id, participant_correlations, output_dir = job
+    pipeline = pipeline or ParticipantInsightPipeline()
+    insights = pipeline.process((participant_columns, participant_id, participant_correlations))
+    
+    # Save individual file; in a worker this keeps the encoding off the parent process
+    if insights and output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_dir / f"patient-{participant_id.replace('participant-', '')}.json"
+        
+        # Encode the whole document up front and hand it to the OS in one write
+        output_file.write_bytes(json.dumps(insights, indent=2, default=str).encode('utf-8'))
+    
+    return participant_id, insights
+
+
 def generate_participant_insights(
     data: HealthDataCollection,
-    output_dir: Path = None
+    output_dir: Path = None,
+    correlation_results: Optional[Dict] = None,
+    bundle: bool = False
 ) -> Dict[str, Dict]:
     """
     Generate insights for all participants.
@@ -595,28 +632,46 @@ def generate_participant_insights(
         Cleaned health data collection
     output_dir : Path, optional
         Directory to save individual participant insights
+    correlation_results : Dict, optional
+        Output of CorrelationEngine for the same collection; computed here if omitted
+    bundle : bool, default False
+        Save every participant to a single ``insights.jsonl`` in ``output_dir``
+        (JSON Lines: one compact insights document per line, in cohort order)
+        instead of one ``patient-<id>.json`` file per participant
         
     Returns
     -------
     Dict[str, Dict]
         Insights for all participants
     """
-    pipeline = ParticipantInsightPipeline()
+    if correlation_results is None:
+        from .correlation_engine import CorrelationEngine
+        correlation_results = CorrelationEngine().process(data)
+    
     all_insights = {}
     
-    for participant_id in data.get_participants():
-        insights = pipeline.process((data, participant_id))
-        
+    # Columnar per-participant arrays, built in one pass over the collection
+    jobs = [
+        (data.as_columns(participant_id), participant_id,
+         correlation_results.get(participant_id, {}), None if bundle else output_dir)
+        for participant_id in data.get_participants()
+    ]
+    
+    results = map_participant_jobs(
+        _generate_participant_job, jobs, _PARALLEL_MIN_PARTICIPANTS,
+        serial_func=partial(_generate_participant_job, pipeline=ParticipantInsightPipeline())
+    )
+    
+    for participant_id, insights in results:
         if insights:
             all_insights[participant_id] = insights
-            
-            # Save individual file
-            if output_dir:
-                output_dir.mkdir(parents=True, exist_ok=True)
-                output_file = output_dir / f"patient-{participant_id.replace('participant-', '')}.json"
-                
-                with open(output_file, 'w') as f:
-                    json.dump(insights, f, indent=2, default=str)
+    
+    if bundle and output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "insights.jsonl", 'w', encoding='utf-8', buffering=1 << 20) as f:
+            for insights in all_insights.values():
+                f.write(json.dumps(insights, default=str))
+                f.write('\n')
     
     return all_insights
 
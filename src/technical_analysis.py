@@ -11,14 +11,39 @@ Provides technical insights including:
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
+from collections import defaultdict
+from functools import cached_property, partial
 from pathlib import Path
 from scipy import stats
-from scipy.stats import pearsonr, spearmanr
 import warnings
 
-from .core import HealthDataRecord, HealthDataCollection, BaseProcessor
+from .core import HealthDataCollection, BaseProcessor, map_participant_jobs
+
+
+# Trend keys: weekday names indexed by datetime.weekday(), month names by month - 1
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+
+
+def _batch_stats(values, percentiles: Tuple[float, ...] = ()) -> Dict[str, float]:
+    """Mean, std, min, median, max and p<q> for each requested percentile, from one np.percentile call"""
+    values = np.asarray(values, dtype=np.float64)
+    points = np.percentile(values, [0, 50, 100, *percentiles])
+    
+    batch = {
+        'mean': values.mean(),
+        'std': values.std(),
+        'min': points[0],
+        'median': points[1],
+        'max': points[2],
+    }
+    for q, point in zip(percentiles, points[3:]):
+        batch[f'p{q}'] = point
+    
+    return batch
 
 
 class MissingnessAnalyzer(BaseProcessor):
@@ -36,6 +61,11 @@ class MissingnessAnalyzer(BaseProcessor):
         'temp': 12,   # Every 2 hours
     }
     
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Per-day entries are one dict per participant, metric and day; off unless asked for
+        self.include_daily_details = kwargs.get('include_daily_details', False)
+    
     def process(self, data: HealthDataCollection) -> Dict:
         """
         Analyze missingness patterns for all participants and metrics.
@@ -52,11 +82,56 @@ class MissingnessAnalyzer(BaseProcessor):
         """
         analysis = {}
         
-        for participant_id in data.get_participants():
-            analysis[participant_id] = self._analyze_participant_missingness(
-                data, participant_id
+        # One groupby over every record gives the actual/good counts per
+        # participant, metric and day; everything below works from those counts
+        frame = data.as_frame()
+        daily = frame['is_good'].groupby(
+            [frame['participant_id'], frame['metric_type'], frame['date']], sort=False, observed=True
+        ).agg(actual='size', good='sum')
+        
+        if daily.empty:
+            analysis['cohort_summary'] = self._compute_cohort_missingness(analysis)
+            return analysis
+        
+        # Reindex the sparse counts onto each participant's full day range:
+        # one dense (day x metric) block per participant, stacked in one array
+        participant_codes, metric_codes, day_codes = daily.index.codes
+        participant_ids, metric_types, days = daily.index.levels
+        day_values = days.to_numpy().astype('datetime64[D]')[day_codes]
+        day_numbers = day_values.astype(np.int64)
+        
+        first_day = np.full(len(participant_ids), day_numbers.max())
+        last_day = np.full(len(participant_ids), day_numbers.min())
+        np.minimum.at(first_day, participant_codes, day_numbers)
+        np.maximum.at(last_day, participant_codes, day_numbers)
+        n_days = last_day - first_day + 1
+        block_start = np.cumsum(n_days) - n_days
+        
+        rows = block_start[participant_codes] + day_numbers - first_day[participant_codes]
+        actual_counts = np.zeros((n_days.sum(), len(metric_types)), dtype=np.int64)
+        good_counts = np.zeros_like(actual_counts)
+        actual_counts[rows, metric_codes] = daily['actual'].to_numpy()
+        good_counts[rows, metric_codes] = daily['good'].to_numpy()
+        
+        # ISO labels for every day of the cohort's range, sliced per participant
+        calendar_start = day_numbers.min()
+        calendar = pd.date_range(day_values.min(), day_values.max()).strftime('%Y-%m-%d').tolist()
+        metric_columns = {metric_type: i for i, metric_type in enumerate(metric_types)}
+        
+        blocks = {}
+        for code, participant_id in enumerate(participant_ids):
+            block = slice(block_start[code], block_start[code] + n_days[code])
+            offset = first_day[code] - calendar_start
+            blocks[participant_id] = (
+                calendar[offset:offset + n_days[code]], actual_counts[block], good_counts[block]
             )
         
+        participants = data.get_participants()
+        jobs = [(*blocks[participant_id], metric_columns) for participant_id in participants]
+        
+        results = map_participant_jobs(partial(_participant_missingness_job, analyzer=self), jobs)
+        analysis.update(zip(participants, results))
+        
         # Add cohort-level summary
         analysis['cohort_summary'] = self._compute_cohort_missingness(analysis)
         
@@ -64,28 +139,30 @@ class MissingnessAnalyzer(BaseProcessor):
     
     def _analyze_participant_missingness(
         self, 
-        data: HealthDataCollection, 
-        participant_id: str
+        day_labels: List[str],
+        actual_counts: np.ndarray,
+        good_counts: np.ndarray,
+        metric_columns: Dict[str, int]
     ) -> Dict:
-        """Analyze missingness for a single participant"""
-        
-        participant_data = data.get_participant_data(participant_id)
+        """Analyze missingness for a single participant from its (day x metric) actual/good counts"""
         
-        if not participant_data:
+        if not day_labels:
             return {}
         
-        # Get date range for this participant
-        dates = [r.datetime.date() for r in participant_data]
-        min_date, max_date = min(dates), max(dates)
-        total_days = (max_date - min_date).days + 1
+        total_days = len(day_labels)
         
         # Analyze each metric
         metric_analysis = {}
         
         for metric_type in self.EXPECTED_FREQUENCIES.keys():
-            metric_records = [r for r in participant_data if r.metric_type == metric_type]
-            
-            if not metric_records:
+            if metric_type in metric_columns:
+                day_actual = actual_counts[:, metric_columns[metric_type]]
+                day_good = good_counts[:, metric_columns[metric_type]]
+                actual = int(day_actual.sum())
+            else:
+                actual = 0
+            
+            if not actual:
                 metric_analysis[metric_type] = {
                     'missingness_ratio': 1.0,
                     'compliance_score': 0.0,
@@ -97,8 +174,7 @@ class MissingnessAnalyzer(BaseProcessor):
             
             # Calculate expected vs actual
             expected = total_days * self.EXPECTED_FREQUENCIES[metric_type]
-            actual = len(metric_records)
-            good_records = len([r for r in metric_records if r.quality_flag == 'good'])
+            good_records = int(day_good.sum())
             
             # Missingness ratio (0 = no missing data, 1 = all missing)
             missingness_ratio = max(0, (expected - actual) / expected)
@@ -109,7 +185,7 @@ class MissingnessAnalyzer(BaseProcessor):
             
             # Daily compliance analysis
             daily_compliance = self._analyze_daily_compliance(
-                metric_records, metric_type, min_date, max_date
+                day_actual, day_good, metric_type, day_labels
             )
             
             metric_analysis[metric_type] = {
@@ -123,8 +199,8 @@ class MissingnessAnalyzer(BaseProcessor):
         
         return {
             'date_range': {
-                'start': min_date.isoformat(),
-                'end': max_date.isoformat(),
+                'start': day_labels[0],
+                'end': day_labels[-1],
                 'total_days': total_days,
             },
             'metrics': metric_analysis,
@@ -133,55 +209,52 @@ class MissingnessAnalyzer(BaseProcessor):
     
     def _analyze_daily_compliance(
         self, 
-        records: List[HealthDataRecord],
+        day_actual: np.ndarray,
+        day_good: np.ndarray,
         metric_type: str,
-        min_date: datetime.date,
-        max_date: datetime.date
+        day_labels: List[str]
     ) -> Dict:
-        """Analyze compliance on a daily basis"""
+        """Analyze compliance on a daily basis (counts aligned with the ISO dates in day_labels)"""
         
         expected_per_day = self.EXPECTED_FREQUENCIES[metric_type]
         
-        # Group records by date
-        daily_records = {}
-        for record in records:
-            date_key = record.datetime.date()
-            if date_key not in daily_records:
-                daily_records[date_key] = []
-            daily_records[date_key].append(record)
-        
-        # Analyze each day
-        daily_stats = []
-        current_date = min_date
-        
-        while current_date <= max_date:
-            day_records = daily_records.get(current_date, [])
-            good_records = [r for r in day_records if r.quality_flag == 'good']
-            
-            compliance_pct = (len(good_records) / expected_per_day) * 100 if expected_per_day > 0 else 0
-            compliance_pct = min(100, compliance_pct)  # Cap at 100%
-            
-            daily_stats.append({
-                'date': current_date.isoformat(),
-                'expected': expected_per_day,
-                'actual': len(day_records),
-                'good': len(good_records),
-                'compliance_percentage': round(compliance_pct, 1),
-            })
-            
-            current_date += timedelta(days=1)
+        # Per-day compliance for the whole range at once, capped at 100%
+        if expected_per_day > 0:
+            compliance = (day_good / expected_per_day) * 100
+        else:
+            compliance = np.zeros(len(day_labels))
+        capped = compliance >= 100
+        compliance_values = np.round(np.minimum(compliance, 100), 1)
         
         # Calculate summary stats
-        compliance_values = [d['compliance_percentage'] for d in daily_stats]
-        
-        return {
-            'daily_details': daily_stats,
-            'mean_compliance': round(np.mean(compliance_values), 1),
-            'median_compliance': round(np.median(compliance_values), 1),
-            'min_compliance': round(np.min(compliance_values), 1),
-            'max_compliance': round(np.max(compliance_values), 1),
-            'std_compliance': round(np.std(compliance_values), 1),
+        summary = _batch_stats(compliance_values)
+        daily_compliance = {
+            'mean_compliance': round(summary['mean'], 1),
+            'median_compliance': round(summary['median'], 1),
+            'min_compliance': round(summary['min'], 1),
+            'max_compliance': round(summary['max'], 1),
+            'std_compliance': round(summary['std'], 1),
         }
+        
+        if not self.include_daily_details:
+            return daily_compliance
+        
+        # Capped days report the integer cap, as min(100, pct) always has
+        daily_stats = [
+            {
+                'date': day,
+                'expected': expected_per_day,
+                'actual': actual,
+                'good': good,
+                'compliance_percentage': 100 if is_capped else compliance_pct,
+            }
+            for day, actual, good, compliance_pct, is_capped in zip(
+                day_labels, day_actual.tolist(), day_good.tolist(),
+                compliance_values.tolist(), capped.tolist()
+            )
+        ]
+        
+        return {'daily_details': daily_stats, **daily_compliance}
     
     def _compute_overall_compliance(self, metric_analysis: Dict) -> Dict:
         """Compute overall compliance across all metrics"""
@@ -246,24 +319,30 @@ class MissingnessAnalyzer(BaseProcessor):
                     metric_scores.append(analysis['metrics'][metric_type]['compliance_score'])
             
             if metric_scores:
+                summary = _batch_stats(metric_scores, (25, 75))
                 metric_compliance[metric_type] = {
-                    'mean': round(np.mean(metric_scores), 1),
-                    'median': round(np.median(metric_scores), 1),
-                    'std': round(np.std(metric_scores), 1),
+                    'mean': round(summary['mean'], 1),
+                    'median': round(summary['median'], 1),
+                    'std': round(summary['std'], 1),
                     'quartiles': {
-                        'q25': round(np.percentile(metric_scores, 25), 1),
-                        'q75': round(np.percentile(metric_scores, 75), 1),
+                        'q25': round(summary['p25'], 1),
+                        'q75': round(summary['p75'], 1),
                     }
                 }
         
+        if overall_scores:
+            overall = _batch_stats(overall_scores, (25, 75))
+        else:
+            overall = dict.fromkeys(['mean', 'median', 'std', 'p25', 'p75'], 0)
+        
         return {
             'overall_compliance_distribution': {
-                'mean': round(np.mean(overall_scores), 1) if overall_scores else 0,
-                'median': round(np.median(overall_scores), 1) if overall_scores else 0,
-                'std': round(np.std(overall_scores), 1) if overall_scores else 0,
+                'mean': round(overall['mean'], 1),
+                'median': round(overall['median'], 1),
+                'std': round(overall['std'], 1),
                 'quartiles': {
-                    'q25': round(np.percentile(overall_scores, 25), 1) if overall_scores else 0,
-                    'q75': round(np.percentile(overall_scores, 75), 1) if overall_scores else 0,
+                    'q25': round(overall['p25'], 1),
+                    'q75': round(overall['p75'], 1),
                 }
             },
             'metric_compliance_distribution': metric_compliance,
@@ -271,6 +350,14 @@ class MissingnessAnalyzer(BaseProcessor):
         }
 
 
+def _participant_missingness_job(
+    job: Tuple[List[str], np.ndarray, np.ndarray, Dict[str, int]],
+    analyzer: MissingnessAnalyzer
+) -> Dict:
+    """Analyze one participant's (day labels, actual counts, good counts, metric columns) block"""
+    return analyzer._analyze_participant_missingness(*job)
+
+
 class NoiseAnalyzer(BaseProcessor):
     """
     Analyzes data noise and trigger frequency patterns.
@@ -292,81 +379,97 @@ class NoiseAnalyzer(BaseProcessor):
         """
         analysis = {}
         
+        # Partition every record once: metric code plus good/outlier masks
+        frame = data.as_frame()
+        values = frame['value_1'].to_numpy()
+        is_good = frame['is_good'].to_numpy().astype(bool)
+        is_outlier = (frame['quality_flag'] == 'outlier').to_numpy()
+        metric_column = frame['metric_type'].cat.codes.to_numpy()
+        metric_codes = {metric_type: code for code, metric_type in enumerate(frame['metric_type'].cat.categories)}
+        
+        # Outlier times of every metric in chronological order, from one stable sort
+        outlier_rows = np.flatnonzero(is_outlier)
+        outlier_times = pd.DatetimeIndex(frame['datetime'].array[outlier_rows])
+        time_order = np.argsort(outlier_times.asi8, kind='stable')
+        outlier_times = outlier_times[time_order]
+        outlier_metric = metric_column[outlier_rows[time_order]]
+        
         for metric_type in data.get_metric_types():
-            metric_data = data.get_metric_data(metric_type)
-            analysis[metric_type] = self._analyze_metric_noise(metric_data, metric_type)
+            code = metric_codes[metric_type]
+            rows = np.flatnonzero(metric_column == code)
+            analysis[metric_type] = self._analyze_metric_noise(
+                metric_type, values[rows], is_good[rows], is_outlier[rows],
+                outlier_times[outlier_metric == code]
+            )
         
         return analysis
     
     def _analyze_metric_noise(
         self, 
-        records: List[HealthDataRecord], 
-        metric_type: str
+        metric_type: str,
+        values: np.ndarray,
+        is_good: np.ndarray,
+        is_outlier: np.ndarray,
+        outlier_times: pd.DatetimeIndex
     ) -> Dict:
-        """Analyze noise patterns for a specific metric"""
+        """Analyze noise patterns for a specific metric (value_1s with aligned quality masks, sorted outlier times)"""
         
-        if not records:
+        if not values.size:
             return {}
         
         # Separate good vs noisy data
-        good_records = [r for r in records if r.quality_flag == 'good']
-        outlier_records = [r for r in records if r.quality_flag == 'outlier']
+        good_values = values[is_good]
+        outlier_values = values[is_outlier]
         
         analysis = {
-            'total_records': len(records),
-            'good_records': len(good_records),
-            'outlier_records': len(outlier_records),
-            'noise_ratio': len(outlier_records) / len(records) if records else 0,
+            'total_records': len(values),
+            'good_records': len(good_values),
+            'outlier_records': len(outlier_values),
+            'noise_ratio': len(outlier_values) / len(values),
         }
         
-        if good_records:
+        if good_values.size:
             # Analyze variability in good data
-            values = [r.value_1 for r in good_records]
+            good_stats = _batch_stats(good_values)
             analysis['good_data_stats'] = {
-                'mean': round(np.mean(values), 2),
-                'std': round(np.std(values), 2),
-                'coefficient_of_variation': round(np.std(values) / np.mean(values), 3) if np.mean(values) != 0 else 0,
-                'range': round(np.max(values) - np.min(values), 2),
+                'mean': round(good_stats['mean'], 2),
+                'std': round(good_stats['std'], 2),
+                'coefficient_of_variation': round(good_stats['std'] / good_stats['mean'], 3) if good_stats['mean'] != 0 else 0,
+                'range': round(good_stats['max'] - good_stats['min'], 2),
             }
         
-        if outlier_records:
+        if outlier_values.size:
             # Analyze outlier patterns
-            outlier_values = [r.value_1 for r in outlier_records]
+            outlier_stats = _batch_stats(outlier_values)
             analysis['outlier_stats'] = {
-                'mean': round(np.mean(outlier_values), 2),
-                'std': round(np.std(outlier_values), 2),
-                'range': round(np.max(outlier_values) - np.min(outlier_values), 2),
+                'mean': round(outlier_stats['mean'], 2),
+                'std': round(outlier_stats['std'], 2),
+                'range': round(outlier_stats['max'] - outlier_stats['min'], 2),
             }
             
             # Temporal clustering of outliers
-            analysis['outlier_temporal_pattern'] = self._analyze_outlier_clustering(outlier_records)
+            analysis['outlier_temporal_pattern'] = self._analyze_outlier_clustering(outlier_times)
         
         return analysis
     
-    def _analyze_outlier_clustering(self, outlier_records: List[HealthDataRecord]) -> Dict:
-        """Analyze if outliers cluster in time"""
+    def _analyze_outlier_clustering(self, times: pd.DatetimeIndex) -> Dict:
+        """Analyze if outliers cluster in time (times already sorted)"""
         
-        if len(outlier_records) < 2:
+        if len(times) < 2:
             return {'clustering_detected': False}
         
-        # Sort by datetime
-        sorted_records = sorted(outlier_records, key=lambda x: x.datetime)
-        
         # Calculate time gaps between consecutive outliers
-        time_gaps = []
-        for i in range(1, len(sorted_records)):
-            gap = sorted_records[i].datetime - sorted_records[i-1].datetime
-            time_gaps.append(gap.total_seconds() / 3600)  # Convert to hours
+        time_gaps = (times[1:] - times[:-1]).total_seconds().to_numpy() / 3600  # Convert to hours
         
         # Detect clustering (outliers within 24 hours of each other)
-        clustered_outliers = sum(1 for gap in time_gaps if gap <= 24)
-        clustering_ratio = clustered_outliers / len(time_gaps) if time_gaps else 0
+        clustered_outliers = int((time_gaps <= 24).sum())
+        clustering_ratio = clustered_outliers / len(time_gaps) if time_gaps.size else 0
         
         return {
             'clustering_detected': clustering_ratio > 0.3,  # If >30% are clustered
             'clustering_ratio': round(clustering_ratio, 3),
-            'mean_gap_hours': round(np.mean(time_gaps), 1) if time_gaps else 0,
-            'median_gap_hours': round(np.median(time_gaps), 1) if time_gaps else 0,
+            'mean_gap_hours': round(np.mean(time_gaps), 1) if time_gaps.size else 0,
+            'median_gap_hours': round(np.median(time_gaps), 1) if time_gaps.size else 0,
         }
 
 
@@ -403,40 +506,47 @@ class CohortAnalyzer(BaseProcessor):
         
         stats = {}
         
+        good_frame = data.as_frame(good_only=True)
+        good_metric = good_frame['metric_type'].cat.codes.to_numpy()
+        metric_codes = {metric_type: code for code, metric_type in enumerate(good_frame['metric_type'].cat.categories)}
+        value_2 = good_frame['value_2'].to_numpy()
+        has_value_2 = good_frame['has_value_2'].to_numpy()
+        
         for metric_type in data.get_metric_types():
-            metric_data = data.get_metric_data(metric_type)
-            good_data = [r for r in metric_data if r.quality_flag == 'good']
+            values = data.get_metric_values(metric_type)
             
-            if not good_data:
+            if not values.size:
                 continue
             
-            values = [r.value_1 for r in good_data]
+            good_rows = np.flatnonzero(good_metric == metric_codes[metric_type])
+            summary = _batch_stats(values, (25, 75, 90, 95))
             
             stats[metric_type] = {
                 'count': len(values),
-                'mean': round(np.mean(values), 2),
-                'median': round(np.median(values), 2),
-                'std': round(np.std(values), 2),
-                'min': round(np.min(values), 2),
-                'max': round(np.max(values), 2),
-                'iqr': round(np.percentile(values, 75) - np.percentile(values, 25), 2),
+                'mean': round(summary['mean'], 2),
+                'median': round(summary['median'], 2),
+                'std': round(summary['std'], 2),
+                'min': round(summary['min'], 2),
+                'max': round(summary['max'], 2),
+                'iqr': round(summary['p75'] - summary['p25'], 2),
                 'percentiles': {
-                    'p25': round(np.percentile(values, 25), 2),
-                    'p50': round(np.percentile(values, 50), 2),
-                    'p75': round(np.percentile(values, 75), 2),
-                    'p90': round(np.percentile(values, 90), 2),
-                    'p95': round(np.percentile(values, 95), 2),
+                    'p25': round(summary['p25'], 2),
+                    'p50': round(summary['median'], 2),
+                    'p75': round(summary['p75'], 2),
+                    'p90': round(summary['p90'], 2),
+                    'p95': round(summary['p95'], 2),
                 }
             }
             
             # Add secondary value stats if available
-            if good_data[0].value_2 is not None:
-                values_2 = [r.value_2 for r in good_data if r.value_2 is not None]
-                if values_2:
+            if has_value_2[good_rows[0]]:
+                values_2 = value_2[good_rows][has_value_2[good_rows]]
+                if values_2.size:
+                    secondary = _batch_stats(values_2)
                     stats[metric_type]['secondary_value'] = {
-                        'mean': round(np.mean(values_2), 2),
-                        'median': round(np.median(values_2), 2),
-                        'std': round(np.std(values_2), 2),
+                        'mean': round(secondary['mean'], 2),
+                        'median': round(secondary['median'], 2),
+                        'std': round(secondary['std'], 2),
                     }
         
         return stats
@@ -445,55 +555,53 @@ class CohortAnalyzer(BaseProcessor):
         """Compute correlations between different health metrics"""
         
         correlations = {}
-        participants = data.get_participants()
         metric_types = data.get_metric_types()
         
-        # Create participant-level aggregated data
-        participant_metrics = {}
-        for participant_id in participants:
-            participant_data = data.get_participant_data(participant_id)
-            good_data = [r for r in participant_data if r.quality_flag == 'good']
-            
-            metrics = {}
-            for metric_type in metric_types:
-                metric_records = [r for r in good_data if r.metric_type == metric_type]
-                if metric_records:
-                    metrics[metric_type] = np.mean([r.value_1 for r in metric_records])
-            
-            if len(metrics) >= 2:  # Need at least 2 metrics for correlation
-                participant_metrics[participant_id] = metrics
-        
-        # Compute pairwise correlations
+        # Participant x metric table of per-participant means over good data
+        good = data.as_frame(good_only=True)
+        participant_means = good['value_1'].groupby(
+            [good['participant_id'], good['metric_type']], sort=False, observed=True
+        ).mean().unstack()
+        
+        # Whole correlation matrices at once; pairs use the participants who have both metrics
+        columns = list(participant_means.columns)
+        pearson_r = participant_means.corr(method='pearson').to_numpy()
+        spearman_r = participant_means.corr(method='spearman').to_numpy()
+        present = participant_means.notna().to_numpy(dtype=np.float64)
+        n_pairs = present.T @ present
+        
+        # Two-sided p-values for every pair, as pearsonr (beta distribution of r)
+        # and spearmanr (t-test on r) compute them
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shape = n_pairs / 2 - 1
+            pearson_p = 2 * stats.beta.cdf(-np.abs(pearson_r), shape, shape, loc=-1, scale=2)
+            dof = n_pairs - 2
+            t_stat = spearman_r * np.sqrt((dof / ((spearman_r + 1.0) * (1.0 - spearman_r))).clip(0))
+            spearman_p = 2 * stats.t.sf(np.abs(t_stat), dof)
+        
+        # Report pairwise correlations
+        position = {metric_type: i for i, metric_type in enumerate(columns)}
         for i, metric1 in enumerate(metric_types):
             for metric2 in metric_types[i+1:]:
-                # Get participants who have both metrics
-                values1, values2 = [], []
+                if metric1 not in position or metric2 not in position:
+                    continue
+                a, b = position[metric1], position[metric2]
+                n_participants = int(n_pairs[a, b])
                 
-                for participant_id, metrics in participant_metrics.items():
-                    if metric1 in metrics and metric2 in metrics:
-                        values1.append(metrics[metric1])
-                        values2.append(metrics[metric2])
-                
-                if len(values1) >= 5:  # Minimum 5 participants for meaningful correlation
-                    try:
-                        pearson_r, pearson_p = pearsonr(values1, values2)
-                        spearman_r, spearman_p = spearmanr(values1, values2)
-                        
-                        correlations[f"{metric1}_vs_{metric2}"] = {
-                            'n_participants': len(values1),
-                            'pearson': {
-                                'r': round(pearson_r, 3),
-                                'p_value': round(pearson_p, 4),
-                                'significant': pearson_p < 0.05,
-                            },
-                            'spearman': {
-                                'r': round(spearman_r, 3),
-                                'p_value': round(spearman_p, 4),
-                                'significant': spearman_p < 0.05,
-                            }
+                if n_participants >= 5:  # Minimum 5 participants for meaningful correlation
+                    correlations[f"{metric1}_vs_{metric2}"] = {
+                        'n_participants': n_participants,
+                        'pearson': {
+                            'r': round(pearson_r[a, b], 3),
+                            'p_value': round(pearson_p[a, b], 4),
+                            'significant': pearson_p[a, b] < 0.05,
+                        },
+                        'spearman': {
+                            'r': round(spearman_r[a, b], 3),
+                            'p_value': round(spearman_p[a, b], 4),
+                            'significant': spearman_p[a, b] < 0.05,
                         }
-                    except Exception as e:
-                        self.logger.warning(f"Failed to compute correlation for {metric1} vs {metric2}: {e}")
+                    }
         
         return correlations
     
@@ -502,35 +610,33 @@ class CohortAnalyzer(BaseProcessor):
         
         trends = {}
         
+        good = data.as_frame(good_only=True)
+        
+        # One groupby per pattern covers every metric; sort=False keeps each
+        # metric's weekdays/months in the order they first appear in the data.
+        # Grouping on the integer weekday/month means names are only looked up per group
+        weekly_means = good['value_1'].groupby(
+            [good['metric_type'], good['weekday']], sort=False, observed=True
+        ).mean()
+        monthly_means = good['value_1'].groupby(
+            [good['metric_type'], good['date'].dt.month], sort=False, observed=True
+        ).mean()
+        
+        weekly_patterns = defaultdict(dict)
+        for (metric_type, week_day), mean in zip(weekly_means.index, weekly_means.tolist()):
+            weekly_patterns[metric_type][_DAY_NAMES[week_day]] = mean
+        
+        monthly_patterns = defaultdict(dict)
+        for (metric_type, month), mean in zip(monthly_means.index, monthly_means.tolist()):
+            monthly_patterns[metric_type][_MONTH_NAMES[month - 1]] = mean
+        
         for metric_type in data.get_metric_types():
-            metric_data = [r for r in data.get_metric_data(metric_type) if r.quality_flag == 'good']
-            
-            if not metric_data:
+            if metric_type not in weekly_patterns:
                 continue
             
-            # Weekly trends
-            weekly_data = {}
-            for record in metric_data:
-                week_day = record.datetime.strftime('%A')
-                if week_day not in weekly_data:
-                    weekly_data[week_day] = []
-                weekly_data[week_day].append(record.value_1)
-            
-            weekly_means = {day: np.mean(values) for day, values in weekly_data.items()}
-            
-            # Seasonal trends (by month)
-            monthly_data = {}
-            for record in metric_data:
-                month = record.datetime.strftime('%B')
-                if month not in monthly_data:
-                    monthly_data[month] = []
-                monthly_data[month].append(record.value_1)
-            
-            monthly_means = {month: np.mean(values) for month, values in monthly_data.items()}
-            
             trends[metric_type] = {
-                'weekly_patterns': weekly_means,
-                'monthly_patterns': monthly_means,
+                'weekly_patterns': weekly_patterns[metric_type],
+                'monthly_patterns': monthly_patterns[metric_type],
             }
         
         return trends
@@ -548,23 +654,20 @@ class CohortAnalyzer(BaseProcessor):
         
         # Quality insights
         total_records = len(data)
-        good_records = len([r for r in data.records if r.quality_flag == 'good'])
+        good_records = int(data.as_frame()['is_good'].sum())
         if total_records > 0:
             good_pct = (good_records / total_records) * 100
             insights.append(f"Overall data quality: {good_pct:.1f}% of records passed quality checks.")
         
         # Metric-specific insights
         for metric_type in metrics:
-            metric_data = [r for r in data.get_metric_data(metric_type) if r.quality_flag == 'good']
+            values = data.get_metric_values(metric_type)
             
-            if not metric_data:
+            if not values.size:
                 continue
             
-            values = [r.value_1 for r in metric_data]
-            participants_with_metric = len(set(r.participant_id for r in metric_data))
-            
             if metric_type == 'bp':
-                high_bp_count = len([v for v in values if v >= 140])  # Systolic >= 140
+                high_bp_count = int((values >= 140).sum())  # Systolic >= 140
                 if high_bp_count > 0:
                     high_bp_pct = (high_bp_count / len(values)) * 100
                     insights.append(f"Blood pressure: {high_bp_pct:.1f}% of readings show elevated systolic pressure (≥140 mmHg).")
@@ -577,8 +680,7 @@ class CohortAnalyzer(BaseProcessor):
                     insights.append(f"Heart rate: Cohort average of {mean_hr:.0f} bpm suggests good cardiovascular fitness.")
             
             elif metric_type == 'steps':
-                mean_steps = np.mean(values)
-                active_days = len([v for v in values if v >= 10000])
+                active_days = int((values >= 10000).sum())
                 if active_days > 0:
                     active_pct = (active_days / len(values)) * 100
                     insights.append(f"Physical activity: {active_pct:.1f}% of days meet the 10,000 steps guideline.")
@@ -598,6 +700,19 @@ class TechnicalReportGenerator(BaseProcessor):
     Generates comprehensive technical reports for researchers.
     """
     
+    # Analyzers are built on first use and reused by later process() calls
+    @cached_property
+    def missingness_analyzer(self) -> MissingnessAnalyzer:
+        return MissingnessAnalyzer(include_daily_details=self.params.get('include_daily_details', False))
+    
+    @cached_property
+    def noise_analyzer(self) -> NoiseAnalyzer:
+        return NoiseAnalyzer()
+    
+    @cached_property
+    def cohort_analyzer(self) -> CohortAnalyzer:
+        return CohortAnalyzer()
+    
     def process(self, data: HealthDataCollection) -> Dict:
         """
         Generate complete technical analysis report.
@@ -614,11 +729,10 @@ class TechnicalReportGenerator(BaseProcessor):
         """
         self.logger.info("Generating technical analysis report")
         
-        # Run all analyses
-        missingness_analyzer = MissingnessAnalyzer()
-        noise_analyzer = NoiseAnalyzer()
-        cohort_analyzer = CohortAnalyzer()
+        # Build the shared collection frame up front; every analyzer reads from it
+        data.as_frame()
         
+        # Run all analyses
         report = {
             'report_metadata': {
                 'generated_at': datetime.now().isoformat(),
@@ -626,9 +740,9 @@ class TechnicalReportGenerator(BaseProcessor):
                 'total_participants': len(data.get_participants()),
                 'metrics_analyzed': data.get_metric_types(),
             },
-            'missingness_analysis': missingness_analyzer.process(data),
-            'noise_analysis': noise_analyzer.process(data),
-            'cohort_analysis': cohort_analyzer.process(data),
+            'missingness_analysis': self.missingness_analyzer.process(data),
+            'noise_analysis': self.noise_analyzer.process(data),
+            'cohort_analysis': self.cohort_analyzer.process(data),
         }
         
         return report
@@ -638,8 +752,8 @@ class TechnicalReportGenerator(BaseProcessor):
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        # Encode in one call and write once, rather than streaming many small chunks
+        output_path.write_bytes(json.dumps(report, indent=2, default=str).encode('utf-8'))
         
         self.logger.info(f"Technical report saved to: {output_path}")
 
@@ -8,16 +8,10 @@ Usage:
 """
 
 import sys
-import os
 from pathlib import Path
 import logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger('test_integrated_pipeline')
+logger = logging.getLogger(__name__)
 
 def run_test():
     """Run the integrated pipeline test"""
@@ -30,13 +24,13 @@ def run_test():
         sys.exit(1)
     
     # Define paths
-    current_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+    current_dir = Path(__file__).resolve().parent
     input_dir = current_dir / "input"
     output_dir = current_dir / "processed" / "integrated_test"
     
-    logger.info(f"Running integrated pipeline test")
-    logger.info(f"Input directory: {input_dir}")
-    logger.info(f"Output directory: {output_dir}")
+    logger.info("Running integrated pipeline test")
+    logger.info("Input directory: %s", input_dir)
+    logger.info("Output directory: %s", output_dir)
     
     try:
         # Run the pipeline
@@ -47,13 +41,16 @@ def run_test():
         )
         
         logger.info("Test completed successfully!")
-        logger.info(f"Generated integrated report: {output_dir / 'integrated_report.html'}")
+        logger.info("Generated integrated report: %s", output_dir / 'integrated_report.html')
         
-    except Exception as e:
-        logger.error(f"Pipeline test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Pipeline test failed")
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     run_test()